@@ -7,15 +7,34 @@ import argparse
 import asyncio
 import logging
 import sys
+from collections.abc import Callable
+from enum import IntEnum
 
-from scansnap.scanner import Scanner
-from scansnap.data import ScanError
-from scansnap.discovery import ScanSnapDiscovery
-from scansnap.packets import ColorMode, PaperSize, Quality, ScanConfig
+from scansnap.packets import ColorMode, PaperSize, Quality
+
+
+def _enum_arg(cls: type[IntEnum]) -> Callable[[str], IntEnum]:
+    """Return an argparse ``type`` that converts a member name to *cls*."""
+    def convert(value: str) -> IntEnum:
+        try:
+            return cls[value.upper()]
+        except KeyError:
+            names = ", ".join(m.name.lower() for m in cls)
+            raise argparse.ArgumentTypeError(
+                f"invalid choice: {value!r} (choose from {names})"
+            ) from None
+    convert.__name__ = cls.__name__
+    return convert
+
+
+def _enum_metavar(cls: type[IntEnum]) -> str:
+    return "{" + ",".join(m.name.lower() for m in cls) + "}"
 
 
 async def cmd_discover(args: argparse.Namespace) -> None:
     """Discover scanners on the network."""
+    from scansnap.discovery import ScanSnapDiscovery
+
     discovery = ScanSnapDiscovery()
     print(f"Local IP: {discovery.local_ip}")
     print("Searching for ScanSnap devices...")
@@ -44,6 +63,8 @@ async def cmd_discover(args: argparse.Namespace) -> None:
 
 async def cmd_pair(args: argparse.Namespace) -> None:
     """Pair with a scanner."""
+    from scansnap.scanner import Scanner
+
     password = getattr(args, "password", None)
     identity = getattr(args, "pair_identity", None)
 
@@ -78,23 +99,26 @@ async def cmd_pair(args: argparse.Namespace) -> None:
 
 async def cmd_scan(args: argparse.Namespace) -> None:
     """Connect and scan."""
+    from scansnap.data import ScanError
+    from scansnap.packets import ScanConfig
+    from scansnap.scanner import Scanner
+
     if args.ip:
         scanner = Scanner(host=args.ip, identity=args.identity)
     else:
         print("Discovering scanner...")
-        scanner = await Scanner.discover(timeout=args.timeout)
-        scanner.identity = args.identity
+        scanner = await Scanner.discover(timeout=args.timeout, identity=args.identity)
 
     print(f"Connecting to {scanner.host}...")
     await scanner.connect()
     print("Connected!")
 
     config = ScanConfig(
-        color_mode=ColorMode[args.color.upper()],
-        quality=Quality[args.quality.upper()],
+        color_mode=args.color,
+        quality=args.quality,
         duplex=not args.simplex,
         bleed_through=args.bleed_through,
-        paper_size=PaperSize[args.paper_size.upper()],
+        paper_size=args.paper_size,
         bw_density=args.bw_density,
         multi_feed=args.multi_feed,
         blank_page_removal=args.blank_page_removal,
@@ -121,8 +145,54 @@ async def cmd_scan(args: argparse.Namespace) -> None:
         print("Disconnected.")
 
 
+def _add_scan_config_args(p: argparse.ArgumentParser) -> None:
+    """Add scan configuration arguments to a subparser."""
+    p.add_argument(
+        "--color", type=_enum_arg(ColorMode), default="auto",
+        metavar=_enum_metavar(ColorMode),
+        help="Color mode (default: auto)",
+    )
+    p.add_argument(
+        "--quality", type=_enum_arg(Quality), default="auto",
+        metavar=_enum_metavar(Quality),
+        help="Scan quality (default: auto)",
+    )
+    p.add_argument(
+        "--simplex", action="store_true", help="Single-sided scan",
+    )
+    p.add_argument(
+        "--bleed-through", action="store_true", default=False,
+        help="Enable bleed-through reduction (default: off)",
+    )
+    p.add_argument(
+        "--paper-size", type=_enum_arg(PaperSize), default="auto",
+        metavar=_enum_metavar(PaperSize),
+        help="Paper size (default: auto)",
+    )
+    p.add_argument(
+        "--bw-density", type=int, default=0,
+        help="B&W density 0-10 (default: 0, only for --color bw)",
+    )
+    p.add_argument(
+        "--multi-feed", action="store_true", default=True,
+        help="Enable multi-feed detection (default: on)",
+    )
+    p.add_argument(
+        "--no-multi-feed", dest="multi_feed", action="store_false",
+        help="Disable multi-feed detection",
+    )
+    p.add_argument(
+        "--blank-page-removal", action="store_true", default=True,
+        help="Enable blank page removal (default: on)",
+    )
+    p.add_argument(
+        "--no-blank-page-removal", dest="blank_page_removal",
+        action="store_false",
+        help="Disable blank page removal",
+    )
 
-def main() -> None:
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="ScanSnap iX500 network scanner client",
     )
@@ -154,52 +224,6 @@ def main() -> None:
         help="Pre-computed identity string",
     )
 
-    def _add_scan_config_args(p: argparse.ArgumentParser) -> None:
-        """Add scan configuration arguments to a subparser."""
-        p.add_argument(
-            "--color", type=str, default="auto",
-            choices=["auto", "color", "gray", "bw"],
-            help="Color mode (default: auto)",
-        )
-        p.add_argument(
-            "--quality", type=str, default="auto",
-            choices=["auto", "normal", "fine", "superfine"],
-            help="Scan quality (default: auto)",
-        )
-        p.add_argument(
-            "--simplex", action="store_true", help="Single-sided scan",
-        )
-        p.add_argument(
-            "--bleed-through", action="store_true", default=False,
-            help="Enable bleed-through reduction (default: off)",
-        )
-        p.add_argument(
-            "--paper-size", type=str, default="auto",
-            choices=["auto", "a4", "a5", "business_card", "postcard"],
-            help="Paper size (default: auto)",
-        )
-        p.add_argument(
-            "--bw-density", type=int, default=0,
-            help="B&W density 0-10 (default: 0, only for --color bw)",
-        )
-        p.add_argument(
-            "--multi-feed", action="store_true", default=True,
-            help="Enable multi-feed detection (default: on)",
-        )
-        p.add_argument(
-            "--no-multi-feed", dest="multi_feed", action="store_false",
-            help="Disable multi-feed detection",
-        )
-        p.add_argument(
-            "--blank-page-removal", action="store_true", default=True,
-            help="Enable blank page removal (default: on)",
-        )
-        p.add_argument(
-            "--no-blank-page-removal", dest="blank_page_removal",
-            action="store_false",
-            help="Disable blank page removal",
-        )
-
     scan_p = sub.add_parser("scan", help="Scan documents")
     scan_p.add_argument(
         "-o", "--output", type=str, default=None, help="Output directory",
@@ -210,13 +234,11 @@ def main() -> None:
         help="Wait for physical button press before scanning",
     )
 
-    args = parser.parse_args()
+    return parser
 
-    logging.basicConfig(
-        level=logging.DEBUG if args.verbose else logging.INFO,
-        format="%(asctime)s %(name)s %(levelname)s %(message)s",
-    )
 
+def _run(args: argparse.Namespace) -> None:
+    """Dispatch a parsed command line to its command."""
     if args.command == "discover":
         asyncio.run(cmd_discover(args))
     elif args.command == "pair":
@@ -225,5 +247,15 @@ def main() -> None:
         asyncio.run(cmd_scan(args))
 
 
+def main() -> None:
+    args = _build_parser().parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(name)s %(levelname)s %(message)s",
+    )
+    _run(args)
+
+
 if __name__ == "__main__":
     main()
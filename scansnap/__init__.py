@@ -1,4 +1,21 @@
-from scansnap.data import ScanError
-from scansnap.scanner import Scanner
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from scansnap.data import ScanError
+    from scansnap.scanner import Scanner
 
 __all__ = ["Scanner", "ScanError"]
+
+
+def __getattr__(name: str):
+    # Import lazily so that using a submodule (e.g. scansnap.packets from
+    # the CLI argument parser) doesn't load the whole protocol stack.
+    if name == "Scanner":
+        from scansnap.scanner import Scanner
+        return Scanner
+    if name == "ScanError":
+        from scansnap.data import ScanError
+        return ScanError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
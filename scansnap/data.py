@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import ipaddress
 import logging
+import socket
 import struct
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable
 
 from scansnap.packets import (
     ADF_NO_PAPER_MASK,
+    MAGIC,
+    PAGE_TRANSFER_LEN,
     ConfigRequest,
     EndScanRequest,
     GetDeviceInfoRequest,
@@ -34,86 +41,330 @@ class ScanError(Exception):
     """Scanner error (no paper, hardware failure, etc.)."""
 
 
+# Precompiled big-endian uint32 decoders for status fields and length prefixes
+_UNPACK_U32 = struct.Struct("!I").unpack_from
+_UNPACK_LEN = struct.Struct("!I").unpack
+
+# StreamReader limit and kernel receive buffer for data channel sockets.
+# The default 64KB limit pauses the transport once 128KB is buffered, i.e.
+# partway through every 256KB page chunk; StreamReader pauses at twice the
+# limit, so this lets several full chunks queue up without a pause/resume.
+_STREAM_LIMIT = 4 * PAGE_TRANSFER_LEN
+
+# TCP keepalive timing (seconds) so idle pooled connections are probed
+# rather than silently dropped by NAT or the scanner
+_KEEPALIVE_IDLE = 10
+_KEEPALIVE_INTERVAL = 5
+_KEEPALIVE_COUNT = 3
+
+# Maximum simultaneously open data channel connections per scanner host.
+# Further opens wait for a connection to be closed, for up to
+# _CONNECTION_SLOT_TIMEOUT seconds.
+_MAX_CONNECTIONS_PER_HOST = 8
+_CONNECTION_SLOT_TIMEOUT = 30.0
+
+# Write buffer high-water mark for data connections
+_WRITE_HIGH_WATER = 64 * 1024
+
+# Per-step response timeouts (seconds) during a scan session.  WaitForScan
+# legitimately blocks until the scan button is pressed, so it gets longer.
+_STEP_TIMEOUT = 30.0
+_WAIT_TIMEOUT = 300.0
+
+# Page chunk requests kept in flight ahead of the chunk being received.
+# The total chunk count isn't known in advance, so a window above 1 sends
+# requests past the final chunk; keep at 1 unless the scanner is known to
+# answer those promptly.
+_PAGE_TRANSFER_WINDOW = 1
+
+# on_page callbacks allowed to run at once.  The scan loop waits for a free
+# slot before handing over the next page, so a slow consumer holds at most
+# this many pages in memory and slows the transfer down.
+_MAX_PAGE_CALLBACKS = 4
+
+
+def _tune_socket(sock: socket.socket) -> None:
+    """Apply data channel socket options."""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _STREAM_LIMIT)
+    # Requests are tiny and strictly request/response — don't let
+    # Nagle hold them back waiting for more data
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    if hasattr(socket, "TCP_QUICKACK"):  # Linux
+        # ACK responses immediately rather than waiting to piggyback on
+        # the next request.  The kernel may drop back to delayed ACKs
+        # later, so this mainly speeds up the first exchanges.
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, _KEEPALIVE_IDLE)
+    elif hasattr(socket, "TCP_KEEPALIVE"):  # macOS
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, _KEEPALIVE_IDLE)
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, _KEEPALIVE_INTERVAL)
+    if hasattr(socket, "TCP_KEEPCNT"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, _KEEPALIVE_COUNT)
+
+
 async def _read_exact(reader: asyncio.StreamReader, n: int) -> bytes:
-    buf = bytearray()
-    while len(buf) < n:
-        chunk = await reader.read(n - len(buf))
-        if not chunk:
-            raise ConnectionError("Connection closed while reading")
-        buf.extend(chunk)
-    return bytes(buf)
+    """Read exactly n bytes, raising ConnectionError on EOF.
 
+    StreamReader.readexactly() fills a single buffer without per-read
+    temporaries, so no manual readinto loop is needed here.
+    """
+    try:
+        return await reader.readexactly(n)
+    except asyncio.IncompleteReadError as e:
+        raise ConnectionError("Connection closed while reading") from e
 
-class DataChannel:
-    """A single TCP data channel connection to port 53218.
 
-    Each logical operation (device info, scan settings, page transfer)
-    uses a separate TCP connection, matching the observed protocol.
+class DataChannel:
+    """TCP data channel connections to port 53218.
+
+    Single-response queries (device info, scan settings, config) share a
+    small pool of idle connections so the TCP handshake and welcome packet
+    are paid once per socket rather than once per request.  A scan session
+    uses its own dedicated connection.  Call :meth:`aclose` to close any
+    pooled connections.
+
+    Open connections per host are capped across all instances on the same
+    event loop; excess opens queue until a connection is closed, and fail
+    with ConnectionError if none is freed in time.
+
+    ``page_window`` is the number of page chunk requests kept in flight
+    ahead of the chunk being received during a scan.  ``pipeline_setup``
+    sends the scan setup requests (settings, config, tone curve, prepare)
+    in a single write instead of one round trip each; it is off by default
+    as not every scanner firmware is known to accept pipelined setup.
     """
 
-    def __init__(self, host: str, port: int, token: bytes) -> None:
+    # Per event loop, per host connection slots
+    _conn_limits: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+    ] = weakref.WeakKeyDictionary()
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        token: bytes,
+        page_window: int = _PAGE_TRANSFER_WINDOW,
+        pipeline_setup: bool = False,
+    ) -> None:
+        if page_window < 1:
+            raise ValueError(f"page_window must be at least 1, got {page_window}")
         self.host = host
         self.port = port
         self.token = token
+        # (family, address) used to connect; resolved once per channel
+        self._resolved: tuple[int, str] | None = None
+        try:
+            ip = ipaddress.ip_address(host)
+        except ValueError:
+            pass
+        else:
+            family = socket.AF_INET6 if ip.version == 6 else socket.AF_INET
+            self._resolved = (family, host)
+        # Requests whose bytes depend only on the token are packed once
+        self._pkt_device_info = GetDeviceInfoRequest(token=token).pack()
+        self._pkt_scan_params = GetScanParamsRequest(token=token).pack()
+        self._pkt_scan_settings = GetScanSettingsRequest(token=token).pack()
+        self._pkt_config = ConfigRequest(token=token).pack()
+        self._pkt_tone_curve = WriteToneCurveRequest(token=token).pack()
+        self._pkt_prepare = PrepareScanRequest(token=token).pack()
+        self._pkt_status = GetStatusRequest(token=token).pack()
+        self._pkt_wait = WaitForScanRequest(token=token).pack()
+        self._pkt_meta = GetPageMetadataRequest(token=token).pack()
+        self._pkt_end_scan = EndScanRequest(token=token).pack()
+        # Batched end-of-sheet requests (see run_scan)
+        self._pkt_sheet_end = self._pkt_meta + self._pkt_status + self._pkt_wait
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._lock = asyncio.Lock()
+        # Open connections and the connection slot each one holds
+        self._open_writers: dict[asyncio.StreamWriter, asyncio.Semaphore] = {}
+        self._step_timeout = _STEP_TIMEOUT
+        self._wait_timeout = _WAIT_TIMEOUT
+        self._page_window = page_window
+        self._pipeline_setup = pipeline_setup
+
+    async def _resolve(self) -> tuple[int, str]:
+        """Return the (family, address) to connect to, resolving on first use."""
+        if self._resolved is None:
+            loop = asyncio.get_running_loop()
+            infos = await loop.getaddrinfo(
+                self.host, self.port, type=socket.SOCK_STREAM,
+            )
+            if not infos:
+                raise OSError(f"Cannot resolve {self.host}")
+            family, _, _, _, sockaddr = infos[0]
+            self._resolved = (family, sockaddr[0])
+        return self._resolved
 
     async def _open(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
-        reader, writer = await asyncio.open_connection(self.host, self.port)
-        welcome = await _read_exact(reader, WelcomePacket.size())
-        WelcomePacket.unpack(welcome)
+        family, address = await self._resolve()
+        limits = self._conn_limits.setdefault(asyncio.get_running_loop(), {})
+        limit = limits.setdefault(
+            self.host, asyncio.Semaphore(_MAX_CONNECTIONS_PER_HOST),
+        )
+        try:
+            await asyncio.wait_for(limit.acquire(), _CONNECTION_SLOT_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise ConnectionError(
+                f"No free data channel connection to {self.host} "
+                f"after {_CONNECTION_SLOT_TIMEOUT:g}s"
+            ) from None
+        try:
+            reader, writer = await asyncio.open_connection(
+                address, self.port, family=family, limit=_STREAM_LIMIT,
+            )
+        except BaseException:
+            limit.release()
+            raise
+        self._open_writers[writer] = limit
+        try:
+            sock = writer.get_extra_info("socket")
+            if sock is not None:
+                _tune_socket(sock)
+            # Requests are tiny and each is followed by a response read, so
+            # writes skip drain(); the limit only matters for a stuck peer
+            writer.transport.set_write_buffer_limits(high=_WRITE_HIGH_WATER)
+            # The welcome carries no data we use; only check its magic
+            welcome = await _read_exact(reader, WelcomePacket.size())
+            if welcome[4:8] != MAGIC:
+                raise ConnectionError("Not a VENS welcome")
+        except BaseException:
+            self._close(writer)
+            raise
         log.debug("Data channel connected to %s:%d", self.host, self.port)
         return reader, writer
 
-    async def _request(self, data: bytes) -> bytes:
-        """Send request, read single VENS response."""
-        reader, writer = await self._open()
+    def _close(self, writer: asyncio.StreamWriter) -> None:
+        """Close a connection from :meth:`_open` and free its slot."""
+        writer.close()
+        limit = self._open_writers.pop(writer, None)
+        if limit is not None:
+            limit.release()
+
+    def __del__(self) -> None:
+        # A channel dropped without aclose() must not keep its slots
+        open_writers = getattr(self, "_open_writers", {})  # __init__ may have failed
+        for writer, limit in open_writers.items():
+            limit.release()
+            try:
+                writer.close()
+            except RuntimeError:  # event loop already closed
+                pass
+        open_writers.clear()
+
+    async def _acquire(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Take an idle pooled connection, or open a new one."""
+        async with self._lock:
+            while self._idle:
+                reader, writer = self._idle.pop()
+                if not writer.is_closing() and not reader.at_eof():
+                    log.debug("Reusing data channel connection to %s:%d", self.host, self.port)
+                    return reader, writer
+                self._close(writer)
+        return await self._open()
+
+    def _release(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+    ) -> None:
+        """Return a healthy connection to the idle pool."""
+        if writer.is_closing():
+            self._close(writer)
+            return
+        self._idle.append((reader, writer))
+
+    async def aclose(self) -> None:
+        """Close all idle pooled connections."""
+        async with self._lock:
+            idle, self._idle = self._idle, []
+        for _, writer in idle:
+            self._close(writer)
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    @contextlib.asynccontextmanager
+    async def session(
+        self,
+    ) -> AsyncIterator[tuple[asyncio.StreamReader, asyncio.StreamWriter]]:
+        """Borrow one pooled connection for a series of requests.
+
+        The connection goes back to the pool afterwards, or is closed if
+        the block raised.
+        """
+        reader, writer = await self._acquire()
         try:
-            writer.write(data)
-            await writer.drain()
-            len_data = await _read_exact(reader, 4)
-            resp_len = int.from_bytes(len_data, "big")
-            rest = await _read_exact(reader, resp_len - 4)
-            return len_data + rest
-        finally:
-            writer.close()
-            await writer.wait_closed()
+            yield reader, writer
+        except BaseException:
+            # Connection state is unknown — don't return it to the pool
+            self._close(writer)
+            raise
+        self._release(reader, writer)
+
+    async def _request_on(
+        self,
+        conn: tuple[asyncio.StreamReader, asyncio.StreamWriter],
+        data: bytes,
+    ) -> bytes:
+        """Send request on an open connection, read single VENS response."""
+        reader, writer = conn
+        writer.write(data)
+        return await self._read_response(reader)
+
+    async def _request(
+        self,
+        data: bytes,
+        conn: tuple[asyncio.StreamReader, asyncio.StreamWriter] | None = None,
+    ) -> bytes:
+        """Send request, read single VENS response.
+
+        Uses *conn* if given, otherwise a connection from the pool.
+        """
+        if conn is not None:
+            return await self._request_on(conn, data)
+        async with self.session() as conn:
+            return await self._request_on(conn, data)
 
     async def get_device_info(self) -> bytes:
         """Query device identity (cmd=0x06, sub=0x12)."""
-        req = GetDeviceInfoRequest(token=self.token)
-        resp = await self._request(req.pack())
+        resp = await self._request(self._pkt_device_info)
         log.info("Device info: %d bytes", len(resp))
         return resp
 
     async def get_scan_params(self) -> bytes:
         """Query scanner capabilities (cmd=0x06, sub=0x90)."""
-        req = GetScanParamsRequest(token=self.token)
-        return await self._request(req.pack())
+        return await self._request(self._pkt_scan_params)
 
     async def get_scan_settings(self) -> bytes:
         """Query current scan settings (cmd=0x06, sub=0xD8)."""
-        req = GetScanSettingsRequest(token=self.token)
-        return await self._request(req.pack())
+        return await self._request(self._pkt_scan_settings)
 
     async def read_all_settings(self) -> dict[str, bytes]:
         """Query all settings-related endpoints and return raw responses."""
         queries = [
-            ("device_info", self.get_device_info),
-            ("scan_params", self.get_scan_params),
-            ("scan_settings", self.get_scan_settings),
+            ("device_info", self._pkt_device_info),
+            ("scan_params", self._pkt_scan_params),
+            ("scan_settings", self._pkt_scan_settings),
         ]
+        # All queries share one connection: a single handshake and welcome
         results: dict[str, bytes] = {}
-        for name, fn in queries:
-            try:
-                results[name] = await fn()
-            except (ConnectionError, OSError) as e:
-                log.warning("Query %s failed: %s", name, e)
-                results[name] = b""
+        try:
+            async with self.session() as conn:
+                for name, packet in queries:
+                    results[name] = await self._request(packet, conn)
+        except (ConnectionError, OSError) as e:
+            for name, _ in queries:
+                if name not in results:
+                    log.warning("Query %s failed: %s", name, e)
+                    results[name] = b""
         return results
 
     async def set_config(self) -> bytes:
         """Send scanner config (cmd=0x08)."""
-        req = ConfigRequest(token=self.token)
-        return await self._request(req.pack())
+        return await self._request(self._pkt_config)
 
     # ------------------------------------------------------------------
     # Scan session — uses a long-lived connection for the entire scan
@@ -122,62 +373,97 @@ class DataChannel:
     async def run_scan(
         self,
         config: ScanConfig,
-        on_page: asyncio.coroutines = None,
+        on_page: Callable[[int, int, bytes], Awaitable[None]] | None = None,
+        on_chunk: Callable[[int, int, bytes, bool], Awaitable[None]] | None = None,
     ) -> list[tuple[int, int, bytes]]:
         """Execute a full scan session.
 
         Returns list of (sheet, side, jpeg_data) tuples.
 
         ``on_page`` is an optional async callback: on_page(sheet, side, jpeg_data).
+        Callbacks run as tasks alongside the remaining page transfers; once a
+        few are running, the transfer waits for one to finish.  All are
+        awaited before the scan session is ended.  The callback owns the
+        page data: ``jpeg_data`` in the returned list is empty, so pages are
+        not all held in memory until the scan ends.
+
+        ``on_chunk`` is an optional async callback for streaming:
+        on_chunk(sheet, side, jpeg_chunk, is_final) is awaited for every chunk
+        as it arrives and page data is not buffered, so ``jpeg_data`` in the
+        returned list is empty.  It cannot be combined with ``on_page``.
         """
+        if on_page and on_chunk:
+            raise ValueError("on_page and on_chunk are mutually exclusive")
+
         reader, writer = await self._open()
         pages: list[tuple[int, int, bytes]] = []
+        page_tasks: list[asyncio.Task] = []
+        callback_slots = asyncio.Semaphore(_MAX_PAGE_CALLBACKS)
+        non_empty = 0
+
+        async def page_callback(sheet: int, side: int, data: bytes) -> None:
+            # The slot was taken by the scan loop before creating this task
+            try:
+                await on_page(sheet, side, data)
+            finally:
+                callback_slots.release()
 
         try:
+            # Setup steps 1-3 only return acknowledgements.  With
+            # pipeline_setup, all of their requests go out in one write up
+            # front and each step below just reads its response in order.
+            config_pkt = config.pack(self.token)
+            if self._pipeline_setup:
+                setup = [self._pkt_scan_settings, config_pkt]
+                if config.bleed_through:
+                    setup.append(self._pkt_tone_curve)
+                setup.append(self._pkt_prepare)
+                writer.write(b"".join(setup))
+
+            def send(packet: bytes) -> None:
+                if not self._pipeline_setup:
+                    writer.write(packet)
+
             # Step 1: Get current settings
-            writer.write(GetScanSettingsRequest(token=self.token).pack())
-            await writer.drain()
-            resp = await self._read_response(reader)
+            send(self._pkt_scan_settings)
+            resp = await self._read_step(reader, writer)
             log.debug("Get settings response: %d bytes", len(resp))
 
             # Step 2: Write scan config
-            writer.write(config.pack(self.token))
-            await writer.drain()
-            resp = await self._read_response(reader)
-            log.debug("Set config response: %d bytes, hex=%s", len(resp), resp.hex())
+            send(config_pkt)
+            resp = await self._read_step(reader, writer)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Set config response: %d bytes, hex=%s", len(resp), resp.hex())
 
             # Step 2.5: Write tone curve for bleed-through reduction (sub=0xDB)
             if config.bleed_through:
                 log.debug("Writing bleed-through tone curve (0xDB)...")
-                writer.write(WriteToneCurveRequest(token=self.token).pack())
-                await writer.drain()
-                resp = await self._read_response(reader)
+                send(self._pkt_tone_curve)
+                resp = await self._read_step(reader, writer)
                 log.debug("Tone curve response: %d bytes", len(resp))
 
             # Step 3: Prepare scan (sub=0xD5)
-            writer.write(PrepareScanRequest(token=self.token).pack())
-            await writer.drain()
-            resp = await self._read_response(reader)
+            send(self._pkt_prepare)
+            resp = await self._read_step(reader, writer)
             log.debug("Prepare scan response: %d bytes", len(resp))
 
             # Step 4: Get status — check for paper in ADF
-            writer.write(GetStatusRequest(token=self.token).pack())
-            await writer.drain()
-            resp = await self._read_response(reader)
+            writer.write(self._pkt_status)
+            resp = await self._read_step(reader, writer)
             log.debug("Status response: %d bytes", len(resp))
 
             if len(resp) >= STATUS_RESP_SCAN_STATUS_OFFSET + 4:
-                scan_status = struct.unpack_from("!I", resp, STATUS_RESP_SCAN_STATUS_OFFSET)[0]
+                scan_status = _UNPACK_U32(resp, STATUS_RESP_SCAN_STATUS_OFFSET)[0]
                 log.info("Scan status: 0x%08X", scan_status)
                 if scan_status & ADF_NO_PAPER_MASK:
                     raise ScanError("No paper in ADF")
 
             # Step 5: Wait for scan (blocks until button pressed or app trigger)
             log.info("Waiting for scan to start...")
-            writer.write(WaitForScanRequest(token=self.token).pack())
+            writer.write(self._pkt_wait)
             await writer.drain()
-            resp = await self._read_response(reader)
-            wait_status = struct.unpack_from("!I", resp, WAIT_RESP_STATUS_OFFSET)[0] if len(resp) >= WAIT_RESP_STATUS_OFFSET + 4 else 0
+            resp = await self._read_step(reader, writer, self._wait_timeout)
+            wait_status = _UNPACK_U32(resp, WAIT_RESP_STATUS_OFFSET)[0] if len(resp) >= WAIT_RESP_STATUS_OFFSET + 4 else 0
             log.info("Scan started (wait_status=%d)", wait_status)
 
             if wait_status != 0:
@@ -199,124 +485,289 @@ class DataChannel:
                         "Requesting page: transfer_sheet=%d side=%d",
                         transfer_sheet, side_idx,
                     )
-                    jpeg_data = await self._transfer_page_chunks(
-                        reader, writer, transfer_sheet,
-                        back_side=side_idx == 1,
-                    )
+                    if on_chunk:
+                        jpeg_data = b""
+                        size = 0
+                        chunks = self._iter_page_chunks(
+                            reader, writer, transfer_sheet,
+                            back_side=side_idx == 1,
+                        )
+                        try:
+                            async for jpeg_chunk, final in chunks:
+                                size += len(jpeg_chunk)
+                                await on_chunk(physical_sheet, side_idx, jpeg_chunk, final)
+                        finally:
+                            # Settle in-flight requests before EndScan if
+                            # on_chunk raised
+                            await chunks.aclose()
+                    else:
+                        jpeg_data = await self._transfer_page_chunks(
+                            reader, writer, transfer_sheet,
+                            back_side=side_idx == 1,
+                        )
+                        size = len(jpeg_data)
+                    if size:
+                        non_empty += 1
                     side_name = "front" if side_idx == 0 else "back"
                     log.info(
                         "Page: physical_sheet=%d side=%s size=%d",
-                        physical_sheet, side_name, len(jpeg_data),
+                        physical_sheet, side_name, size,
                     )
-                    pages.append((physical_sheet, side_idx, jpeg_data))
+                    # Only keep the data when nothing else consumes it
+                    pages.append((
+                        physical_sheet, side_idx, b"" if on_page else jpeg_data,
+                    ))
                     if on_page:
-                        await on_page(physical_sheet, side_idx, jpeg_data)
-
-                    # Page metadata after each transfer sheet
-                    writer.write(
-                        GetPageMetadataRequest(token=self.token).pack(),
-                    )
-                    await writer.drain()
-                    meta = await self._read_response(reader)
-                    log.debug("Page metadata: %d bytes", len(meta))
+                        # Overlap the callback (typically disk I/O) with the
+                        # following protocol steps and transfers.  Waiting
+                        # for a free slot first throttles the transfer when
+                        # the consumer falls behind.
+                        await callback_slots.acquire()
+                        page_tasks.append(asyncio.create_task(
+                            page_callback(physical_sheet, side_idx, jpeg_data),
+                        ))
 
                     transfer_sheet += 1
 
-                # Check if more physical sheets are available
-                writer.write(GetStatusRequest(token=self.token).pack())
-                await writer.drain()
-                status_resp = await self._read_response(reader)
+                    # Page metadata after each transfer sheet (the last
+                    # side's request is batched with the status/wait below)
+                    if side_idx < sides_per_sheet - 1:
+                        writer.write(self._pkt_meta)
+                        meta = await self._read_step(reader, writer)
+                        log.debug("Page metadata: %d bytes", len(meta))
+
+                # Page metadata, status check and wait for the next physical
+                # sheet don't depend on each other's responses — send them in
+                # one write and read the three responses in order
+                writer.write(self._pkt_sheet_end)
+                meta = await self._read_step(reader, writer)
+                log.debug("Page metadata: %d bytes", len(meta))
+                status_resp = await self._read_step(reader, writer)
 
                 if len(status_resp) >= STATUS_RESP_SCAN_STATUS_OFFSET + 4:
-                    scan_status = struct.unpack_from("!I", status_resp, STATUS_RESP_SCAN_STATUS_OFFSET)[0]
+                    scan_status = _UNPACK_U32(status_resp, STATUS_RESP_SCAN_STATUS_OFFSET)[0]
                     log.info("Scan status: 0x%08X", scan_status)
 
                 # Wait for next physical sheet — status != 0 means scan complete
-                writer.write(WaitForScanRequest(token=self.token).pack())
-                await writer.drain()
-                resp = await self._read_response(reader)
-                wait_status = struct.unpack_from("!I", resp, WAIT_RESP_STATUS_OFFSET)[0] if len(resp) >= WAIT_RESP_STATUS_OFFSET + 4 else 0
+                resp = await self._read_step(reader, writer, self._wait_timeout)
+                wait_status = _UNPACK_U32(resp, WAIT_RESP_STATUS_OFFSET)[0] if len(resp) >= WAIT_RESP_STATUS_OFFSET + 4 else 0
                 if wait_status != 0:
                     log.info("WaitForScan status=%d, scan complete", wait_status)
                     break
 
                 physical_sheet += 1
 
-            non_empty = sum(1 for _, _, d in pages if d)
+            await asyncio.gather(*page_tasks)
+
             log.info("Scan finished: %d page(s) received (%d non-empty)", len(pages), non_empty)
 
+        except asyncio.CancelledError:
+            # Callbacks may be blocked on a consumer that has gone away
+            for task in page_tasks:
+                task.cancel()
+            raise
         finally:
-            # End scan session (sub=0xD6) — required to reset scanner state
-            try:
-                writer.write(EndScanRequest(token=self.token).pack())
-                await writer.drain()
-                await self._read_response(reader)
-                log.debug("End scan session OK")
-            except (ConnectionError, OSError):
-                pass
-            writer.close()
+            # Let outstanding callbacks finish even if the scan failed
+            if page_tasks:
+                await asyncio.gather(*page_tasks, return_exceptions=True)
+
+            # End scan session (sub=0xD6) — required to reset scanner state.
+            # Skipped if the connection was already dropped after a timeout.
+            if not writer.is_closing():
+                try:
+                    writer.write(self._pkt_end_scan)
+                    await asyncio.wait_for(
+                        self._read_response(reader), self._step_timeout,
+                    )
+                    log.debug("End scan session OK")
+                except (ConnectionError, OSError, asyncio.TimeoutError):
+                    pass
+            self._close(writer)
             await writer.wait_closed()
 
         return pages
 
-    async def _transfer_page_chunks(
+    async def _iter_page_chunks(
         self,
         reader: asyncio.StreamReader,
         writer: asyncio.StreamWriter,
         sheet: int,
         back_side: bool = False,
-    ) -> bytes:
-        """Request page chunks until the full JPEG is received.
+    ) -> AsyncIterator[tuple[bytes, bool]]:
+        """Request page chunks and yield ``(jpeg_chunk, is_final)`` as they arrive.
 
         The scanner sends data in 256KB chunks.  ``page_type=0`` means
         more chunks follow; ``page_type=2`` marks the final chunk.
-        All chunks are concatenated to form one complete JPEG.
+
+        Requests are pipelined: as soon as a chunk's header shows more data
+        follows, requests are sent to keep ``self._page_window`` chunks in
+        flight ahead of it, so the scanner can start sending them while the
+        current chunk body is still being read.  With a window above 1,
+        requests may be issued past the final chunk; their responses are
+        read and discarded before returning.
         """
         chunk = 0
-        jpeg_buf = bytearray()
+        next_chunk = 0  # index of the next chunk to request
 
-        while True:
+        def request(n: int) -> None:
             req = PageTransferRequest(
-                token=self.token, sheet=sheet, chunk=chunk,
+                token=self.token, sheet=sheet, chunk=n,
                 back_side=back_side,
             )
             writer.write(req.pack())
-            await writer.drain()
 
-            # Read length-prefix first to handle error responses (< 42 bytes)
-            len_data = await _read_exact(reader, 4)
-            total_length = int.from_bytes(len_data, "big")
+        request(next_chunk)
+        next_chunk += 1
 
-            if total_length < PageHeader.size():
-                # Scanner returned an error/short response, not a page header
-                rest = await _read_exact(reader, total_length - 4)
-                raise ScanError(
-                    f"Page transfer error: expected page header, got {total_length} bytes"
+        # Whether the stream is at a response boundary
+        framed = True
+        try:
+            while True:
+                framed = False
+                # Read length-prefix first to handle error responses (< 42 bytes).
+                # Both reads are served from the stream buffer, so this costs no
+                # extra syscall over a single 42-byte read.
+                len_data = await self._read_exact_step(reader, 4, writer)
+                total_length = _UNPACK_LEN(len_data)[0]
+
+                if total_length < PageHeader.size():
+                    # Scanner returned an error/short response, not a page header
+                    await self._read_exact_step(reader, total_length - 4, writer)
+                    framed = True
+                    raise ScanError(
+                        f"Page transfer error: expected page header, got {total_length} bytes"
+                    )
+
+                # Read the rest of the 42-byte header
+                rest_header = await self._read_exact_step(
+                    reader, PageHeader.size() - 4, writer,
+                )
+                header_data = len_data + rest_header
+                header = PageHeader.unpack(header_data)
+                log.debug(
+                    "Chunk: sheet=%d chunk=%d page_type=%d size=%d",
+                    sheet, chunk, header.page_type, header.jpeg_size,
                 )
 
-            # Read the rest of the 42-byte header
-            rest_header = await _read_exact(reader, PageHeader.size() - 4)
-            header_data = len_data + rest_header
-            header = PageHeader.unpack(header_data)
-            log.debug(
-                "Chunk: sheet=%d chunk=%d page_type=%d size=%d",
-                sheet, chunk, header.page_type, header.jpeg_size,
-            )
+                final = header.page_type == PAGE_TYPE_FINAL
+                if not final and next_chunk <= chunk + self._page_window:
+                    # Pipeline: refill the window before reading this body
+                    while next_chunk <= chunk + self._page_window:
+                        request(next_chunk)
+                        next_chunk += 1
+
+                # The body is taken from the StreamReader rather than via
+                # loop.sock_recv_into(): the socket is owned by the stream
+                # transport (asyncio refuses sock_* calls on it) and part of the
+                # body may already sit in the reader's buffer.  readexactly()
+                # hands back a single bytes object, and a one-chunk page is then
+                # returned by b"".join() without a further copy.
+                jpeg_chunk = await self._read_exact_step(
+                    reader, header.jpeg_size, writer,
+                )
+                framed = True
+                yield jpeg_chunk, final
 
-            jpeg_chunk = await _read_exact(reader, header.jpeg_size)
-            jpeg_buf.extend(jpeg_chunk)
+                if final:
+                    break
 
-            if header.page_type == PAGE_TYPE_FINAL:
-                break  # Final chunk
+                chunk += 1
+        except BaseException as e:
+            # Responses to chunk requests still in flight would otherwise be
+            # read as the replies to later requests such as EndScan
+            outstanding = next_chunk - chunk - 1
+            if outstanding and not writer.is_closing():
+                # GeneratorExit: the consumer stopped early (e.g. on_chunk
+                # raised), which leaves the stream framed as well
+                if framed and isinstance(e, (Exception, GeneratorExit)):
+                    await self._discard_responses(reader, writer, outstanding)
+                else:
+                    self._close(writer)
+            raise
+
+        # Drain responses to any requests issued beyond the final chunk
+        for _ in range(next_chunk - chunk - 1):
+            await self._read_step(reader, writer)
+
+        log.debug("Transfer sheet %d: %d chunk(s)", sheet, chunk + 1)
+
+    async def _discard_responses(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        count: int,
+    ) -> None:
+        """Read and drop *count* pipelined responses after a failed transfer.
 
-            chunk += 1
+        If they can't be read, the connection is closed instead.
+        """
+        try:
+            for _ in range(count):
+                await self._read_step(reader, writer)
+        except (ScanError, ConnectionError, OSError):
+            self._close(writer)
 
-        log.debug("Transfer sheet %d: %d bytes in %d chunk(s)", sheet, len(jpeg_buf), chunk + 1)
-        return bytes(jpeg_buf)
+    async def _transfer_page_chunks(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        sheet: int,
+        back_side: bool = False,
+    ) -> bytes:
+        """Request page chunks until the full JPEG is received.
+
+        All chunks are concatenated to form one complete JPEG.
+        """
+        chunks: list[bytes] = []
+        async for jpeg_chunk, _ in self._iter_page_chunks(
+            reader, writer, sheet, back_side=back_side,
+        ):
+            chunks.append(jpeg_chunk)
+
+        # join() sizes the result once and copies each chunk in a single pass
+        jpeg_data = b"".join(chunks)
+        log.debug("Transfer sheet %d: %d bytes", sheet, len(jpeg_data))
+        return jpeg_data
+
+    async def _read_step(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        timeout: float | None = None,
+    ) -> bytes:
+        """Read a scan-session VENS response, failing if the scanner stalls."""
+        return await self._bounded(self._read_response(reader), writer, timeout)
+
+    async def _read_exact_step(
+        self,
+        reader: asyncio.StreamReader,
+        n: int,
+        writer: asyncio.StreamWriter,
+    ) -> bytes:
+        """Read exactly n bytes of a scan-session response, with the step timeout."""
+        return await self._bounded(_read_exact(reader, n), writer)
+
+    async def _bounded(
+        self,
+        read: Awaitable[bytes],
+        writer: asyncio.StreamWriter,
+        timeout: float | None = None,
+    ) -> bytes:
+        """Await a scan-session read with the step timeout.
+
+        On timeout the connection is closed, since its framing can no
+        longer be trusted, and ScanError is raised.
+        """
+        try:
+            return await asyncio.wait_for(
+                read, self._step_timeout if timeout is None else timeout,
+            )
+        except asyncio.TimeoutError:
+            self._close(writer)
+            raise ScanError("Scanner unresponsive") from None
 
     async def _read_response(self, reader: asyncio.StreamReader) -> bytes:
         """Read a standard VENS response (length-prefixed)."""
         len_data = await _read_exact(reader, 4)
-        resp_len = int.from_bytes(len_data, "big")
-        rest = await _read_exact(reader, resp_len - 4)
+        rest = await _read_exact(reader, _UNPACK_LEN(len_data)[0] - 4)
         return len_data + rest
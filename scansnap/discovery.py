@@ -3,28 +3,36 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-import os
 import socket
 import struct
 
 from scansnap.packets import (
+    BROADCAST_ADVERTISEMENT_SIZE,
     BROADCAST_PORT,
     CLIENT_DISCOVERY_PORT,
     CLIENT_NOTIFY_PORT,
     DISCOVERY_PORT,
+    EVENT_NOTIFICATION_SIZE,
     MAGIC,
     BroadcastAdvertisement,
     DeviceInfo,
     DiscoveryRequest,
     EventNotification,
+    new_token,
 )
 
 log = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def _get_local_ip() -> str:
-    """Get the local IP address used for LAN communication."""
+    """Get the local IP address used for LAN communication.
+
+    The route lookup runs once per process; ScanSnapDiscovery.refresh()
+    clears the cached result after a network change.
+    """
     s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     try:
         s.connect(("192.168.0.1", 80))
@@ -42,6 +50,9 @@ class _BroadcastProtocol(asyncio.DatagramProtocol):
         self._future = future
 
     def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        # Drop unrelated traffic on the shared port without raising
+        if len(data) < BROADCAST_ADVERTISEMENT_SIZE or data[4:8] != MAGIC:
+            return
         try:
             adv = BroadcastAdvertisement.unpack(data)
             log.info("Broadcast from %s: device_ip=%s", addr, adv.device_ip)
@@ -54,8 +65,9 @@ class _BroadcastProtocol(asyncio.DatagramProtocol):
 class _DiscoveryProtocol(asyncio.DatagramProtocol):
     """Sends discovery requests and receives device info on UDP:52217/55264."""
 
-    def __init__(self, future: asyncio.Future[DeviceInfo]):
+    def __init__(self, future: asyncio.Future[DeviceInfo], local_ip: str):
         self._future = future
+        self._local_ip = local_ip
         self._transport: asyncio.DatagramTransport | None = None
 
     def connection_made(self, transport: asyncio.DatagramTransport) -> None:
@@ -83,12 +95,20 @@ class _DiscoveryProtocol(asyncio.DatagramProtocol):
                 log.debug("Failed to parse device info: %s", e)
 
     def send_discovery(self, scanner_ip: str, token: bytes) -> None:
-        local_ip = _get_local_ip()
-        req = DiscoveryRequest(client_ip=local_ip, token=token)
+        self.send_discovery_many([scanner_ip], token)
+
+    def send_discovery_many(self, scanner_ips: list[str], token: bytes) -> None:
+        """Send VENS and ssNR discovery requests to each address.
+
+        Both payloads are packed once and reused for every destination.
+        """
+        req = DiscoveryRequest(client_ip=self._local_ip, token=token)
+        vens, ssnr = req.pack_vens(), req.pack_ssnr()
         assert self._transport is not None
-        self._transport.sendto(req.pack_vens(), (scanner_ip, DISCOVERY_PORT))
-        self._transport.sendto(req.pack_ssnr(), (scanner_ip, DISCOVERY_PORT))
-        log.debug("Sent discovery to %s:%d", scanner_ip, DISCOVERY_PORT)
+        for scanner_ip in scanner_ips:
+            self._transport.sendto(vens, (scanner_ip, DISCOVERY_PORT))
+            self._transport.sendto(ssnr, (scanner_ip, DISCOVERY_PORT))
+            log.debug("Sent discovery to %s:%d", scanner_ip, DISCOVERY_PORT)
 
 
 class _NotifyProtocol(asyncio.DatagramProtocol):
@@ -98,6 +118,9 @@ class _NotifyProtocol(asyncio.DatagramProtocol):
         self._future = future
 
     def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        # Drop unrelated traffic on the shared port without raising
+        if len(data) < EVENT_NOTIFICATION_SIZE or data[4:8] != MAGIC:
+            return
         try:
             evt = EventNotification.unpack(data)
             log.info("Event from %s: type=%d data=0x%08X", addr, evt.event_type, evt.event_data)
@@ -107,13 +130,35 @@ class _NotifyProtocol(asyncio.DatagramProtocol):
             pass
 
 
+class _HeartbeatProtocol(asyncio.DatagramProtocol):
+    """Watches for the scanner's heartbeat ACKs on UDP:52217."""
+
+    def __init__(self, scanner_ip: str, ready: asyncio.Event):
+        self._scanner_ip = scanner_ip
+        self._ready = ready
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        if addr[0] != self._scanner_ip or MAGIC not in (data[0:4], data[4:8]):
+            return
+        if not self._ready.is_set():
+            log.debug("First heartbeat ACK from %s", addr)
+            self._ready.set()
+
+
 class ScanSnapDiscovery:
     """Discover ScanSnap devices on the local network."""
 
     def __init__(self) -> None:
         self.local_ip = _get_local_ip()
         self._heartbeat_task: asyncio.Task | None = None
-        self._heartbeat_sock: socket.socket | None = None
+        self._heartbeat_transport: asyncio.DatagramTransport | None = None
+        # Set once the scanner has acknowledged a heartbeat
+        self.heartbeat_ready = asyncio.Event()
+
+    def refresh(self) -> None:
+        """Re-detect the local IP address, e.g. after switching networks."""
+        _get_local_ip.cache_clear()
+        self.local_ip = _get_local_ip()
 
     async def wait_for_broadcast(self, timeout: float = 30) -> BroadcastAdvertisement:
         """Wait for a scanner broadcast advertisement on UDP:53220."""
@@ -144,7 +189,7 @@ class ScanSnapDiscovery:
     ) -> DeviceInfo:
         """Discover a scanner, either by IP or by listening for broadcasts."""
         if token is None:
-            token = os.urandom(6) + b"\x00\x00"
+            token = new_token()
 
         loop = asyncio.get_event_loop()
         future: asyncio.Future[DeviceInfo] = loop.create_future()
@@ -159,7 +204,7 @@ class ScanSnapDiscovery:
         sock.setblocking(False)
 
         transport, protocol = await loop.create_datagram_endpoint(
-            lambda: _DiscoveryProtocol(future),
+            lambda: _DiscoveryProtocol(future, self.local_ip),
             sock=sock,
         )
         try:
@@ -169,12 +214,12 @@ class ScanSnapDiscovery:
             else:
                 # Send discovery to limited broadcast — works across subnets
                 log.info("Sending broadcast discovery...")
-                protocol.send_discovery("255.255.255.255", token)
+                targets = ["255.255.255.255"]
                 # Also try subnet broadcast based on local IP
                 parts = self.local_ip.rsplit(".", 1)
                 if len(parts) == 2:
-                    subnet_broadcast = parts[0] + ".255"
-                    protocol.send_discovery(subnet_broadcast, token)
+                    targets.append(parts[0] + ".255")
+                protocol.send_discovery_many(targets, token)
 
             return await asyncio.wait_for(future, timeout)
         finally:
@@ -190,23 +235,29 @@ class ScanSnapDiscovery:
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
         sock.bind(("", CLIENT_DISCOVERY_PORT))
         sock.setblocking(False)
-        self._heartbeat_sock = sock
+        loop = asyncio.get_event_loop()
+        self.heartbeat_ready.clear()
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _HeartbeatProtocol(scanner_ip, self.heartbeat_ready), sock=sock,
+        )
+        self._heartbeat_transport = transport
         self._heartbeat_task = asyncio.create_task(
-            self._heartbeat_loop(scanner_ip, token, sock, interval),
+            self._heartbeat_loop(scanner_ip, token, transport, interval),
         )
         log.info("Heartbeat started (every %.1fs to %s)", interval, scanner_ip)
 
     async def _heartbeat_loop(
         self, scanner_ip: str, token: bytes,
-        sock: socket.socket, interval: float,
+        transport: asyncio.DatagramTransport, interval: float,
     ) -> None:
         req = DiscoveryRequest(
             client_ip=self.local_ip, token=token, flags=1,
         )
         packet = req.pack_vens()
+        addr = (scanner_ip, DISCOVERY_PORT)
         try:
             while True:
-                sock.sendto(packet, (scanner_ip, DISCOVERY_PORT))
+                transport.sendto(packet, addr)
                 await asyncio.sleep(interval)
         except asyncio.CancelledError:
             pass
@@ -220,9 +271,9 @@ class ScanSnapDiscovery:
             except asyncio.CancelledError:
                 pass
             self._heartbeat_task = None
-        if self._heartbeat_sock:
-            self._heartbeat_sock.close()
-            self._heartbeat_sock = None
+        if self._heartbeat_transport:
+            self._heartbeat_transport.close()
+            self._heartbeat_transport = None
         log.info("Heartbeat stopped")
 
     async def wait_for_button(self, timeout: float = 300) -> EventNotification:
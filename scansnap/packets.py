@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import socket
 import struct
 from dataclasses import dataclass, field
@@ -19,6 +21,11 @@ CLIENT_DISCOVERY_PORT = 55264
 CLIENT_NOTIFY_PORT = 55265
 
 
+def new_token() -> bytes:
+    """Generate a session token: 6 random bytes followed by two NULs."""
+    return os.urandom(6) + b"\x00\x00"
+
+
 class ControlCommand(IntEnum):
     RESERVE = 0x11
     RELEASE = 0x12
@@ -77,6 +84,10 @@ PAPER_DIMENSIONS: dict[int, tuple[int, int]] = {
 
 _QUALITY_DPI = {Quality.AUTO: 0, Quality.NORMAL: 150, Quality.FINE: 200, Quality.SUPERFINE: 300}
 
+# Reverse lookups for decoding a config read back from the scanner
+_DPI_TO_QUALITY = {dpi: q for q, dpi in _QUALITY_DPI.items()}
+_DIMS_TO_PAPER = {dims: ps for ps, dims in PAPER_DIMENSIONS.items()}
+
 # SCSI opcodes (CDB byte 0)
 SCSI_OPCODE_REQUEST_SENSE = 0x03
 SCSI_OPCODE_INQUIRY = 0x12
@@ -94,6 +105,28 @@ ADF_NO_PAPER_MASK = 0x80
 PAGE_TYPE_MORE = 0   # More chunks follow
 PAGE_TYPE_FINAL = 2  # Last chunk of a page
 
+# Fixed UDP packet sizes
+BROADCAST_ADVERTISEMENT_SIZE = 48
+EVENT_NOTIFICATION_SIZE = 48
+
+# Precompiled layouts shared by the packers/unpackers below
+_U16 = struct.Struct("!H")
+_U16X2 = struct.Struct("!HH")
+_U32 = struct.Struct("!I")
+_U32X3 = struct.Struct("!III")
+_PARAMS7 = struct.Struct("!IIIIIII")
+_PARAMS8 = struct.Struct("!IIIIIIII")
+_PARAMS9 = struct.Struct("!IIIIIIIII")
+_DISCOVERY = struct.Struct("!4sI4s8sHH8s")
+_DATETIME = struct.Struct("!HBBBBB")  # year, month, day, hour, minute, second
+# Unpack layouts read straight from the receive buffer, so bytes, bytearray
+# and memoryview input all work without slicing out fields first
+_BROADCAST = struct.Struct("!4x4sI8x4s6s")  # magic, command, IP, device ID
+_NOTIFICATION = struct.Struct("!4x4sI4xI")  # magic, event type, event data
+_PAGE_HEADER = struct.Struct("!I4s4xI24xBB")  # length, magic, type, sheet, side
+# DeviceInfo fields up to the client IP; padding bytes are skipped
+_DEVICE_INFO = struct.Struct("!4sH2xH6x4s2xH2xH6s2xI64s16s4s")
+
 # Response field offsets
 STATUS_RESP_SCAN_STATUS_OFFSET = 40  # uint32 at resp[40:44]
 WAIT_RESP_STATUS_OFFSET = 12         # uint32 at resp[12:16]
@@ -112,37 +145,54 @@ def _ip_from_bytes(b: bytes) -> str:
 
 
 def _mac_to_str(b: bytes) -> str:
-    return ":".join(f"{x:02x}" for x in b)
+    return b.hex(":")
+
+
+def _with_token(template: bytes, token: bytes) -> bytes:
+    """Copy a prebuilt request with the session token at offset 16."""
+    buf = bytearray(template)
+    buf[16:24] = token
+    return bytes(buf)
 
 
 def _null_terminated(b: bytes) -> str:
-    idx = b.find(b"\x00")
-    return b[:idx].decode("ascii", errors="replace") if idx >= 0 else b.decode("ascii", errors="replace")
+    return b.partition(b"\x00")[0].decode("ascii", errors="replace")
+
+
+class _Request:
+    """Base for requests packed without arguments: ``bytes(req)`` is ``req.pack()``.
+
+    Subclasses define ``pack()``.
+    """
+    __slots__ = ()
+
+    def __bytes__(self) -> bytes:
+        return self.pack()
 
 
 # ---------------------------------------------------------------------------
 # UDP packets
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class BroadcastAdvertisement:
     """Scanner → broadcast (UDP:53220), 48 bytes."""
     device_ip: str = ""
     device_id: bytes = b""
 
     @classmethod
-    def unpack(cls, data: bytes) -> BroadcastAdvertisement:
-        if len(data) < 48 or data[4:8] != MAGIC:
+    def unpack(cls, data: bytes | memoryview) -> BroadcastAdvertisement:
+        if len(data) < BROADCAST_ADVERTISEMENT_SIZE:
+            raise ValueError("Not a VENS broadcast")
+        magic, cmd, ip_raw, dev_id = _BROADCAST.unpack_from(data, 0)
+        if magic != MAGIC:
             raise ValueError("Not a VENS broadcast")
-        cmd = struct.unpack_from("!I", data, 8)[0]
         if cmd != 0x21:
             raise ValueError(f"Unexpected broadcast command: 0x{cmd:X}")
-        ip = _ip_from_bytes(data[20:24])
-        dev_id = data[24:30]
-        return cls(device_ip=ip, device_id=dev_id)
+        return cls(device_ip=_ip_from_bytes(ip_raw), device_id=dev_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveryRequest:
     """Client → scanner (UDP:52217), 32 bytes each for VENS and ssNR."""
     client_ip: str = ""
@@ -151,8 +201,7 @@ class DiscoveryRequest:
     flags: int = 0x00000000  # 0=discovery, 1=heartbeat
 
     def pack_vens(self) -> bytes:
-        return struct.pack(
-            "!4sI4s8sHH8s",
+        return _DISCOVERY.pack(
             MAGIC,
             self.flags,
             _ip_to_bytes(self.client_ip),
@@ -163,8 +212,7 @@ class DiscoveryRequest:
         )
 
     def pack_ssnr(self) -> bytes:
-        return struct.pack(
-            "!4sI4s8sHH8s",
+        return _DISCOVERY.pack(
             MAGIC_SSNR,
             0,
             _ip_to_bytes(self.client_ip),
@@ -175,7 +223,7 @@ class DiscoveryRequest:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceInfo:
     """Scanner → client (UDP:55264), 132 bytes."""
     paired: bool = False
@@ -190,46 +238,42 @@ class DeviceInfo:
     client_ip: str = ""
 
     @classmethod
-    def unpack(cls, data: bytes) -> DeviceInfo:
-        if len(data) < 132 or data[0:4] != MAGIC:
+    def unpack(cls, data: bytes | memoryview) -> DeviceInfo:
+        if len(data) < 132:
+            raise ValueError("Not a VENS device info")
+        (
+            magic, paired, version, device_ip_raw, data_port, control_port,
+            mac_raw, state, serial_raw, name_raw, client_ip_raw,
+        ) = _DEVICE_INFO.unpack_from(data, 0)
+        if magic != MAGIC:
             raise ValueError("Not a VENS device info")
-        paired = struct.unpack_from("!H", data, 4)[0] != 0
-        version = struct.unpack_from("!H", data, 8)[0]
-        device_ip = _ip_from_bytes(data[16:20])
-        data_port = struct.unpack_from("!H", data, 22)[0]
-        control_port = struct.unpack_from("!H", data, 26)[0]
-        mac = _mac_to_str(data[28:34])
-        state = struct.unpack_from("!I", data, 36)[0]
-        serial = _null_terminated(data[40:104])
-        name = _null_terminated(data[104:120])
-        client_ip_raw = data[120:124]
-        client_ip = _ip_from_bytes(client_ip_raw) if client_ip_raw != b"\x00\x00\x00\x00" else ""
         return cls(
-            paired=paired,
+            paired=paired != 0,
             protocol_version=version,
-            device_ip=device_ip,
+            device_ip=_ip_from_bytes(device_ip_raw),
             data_port=data_port,
             control_port=control_port,
-            mac=mac,
+            mac=_mac_to_str(mac_raw),
             state=state,
-            serial=serial,
-            name=name,
-            client_ip=client_ip,
+            serial=_null_terminated(serial_raw),
+            name=_null_terminated(name_raw),
+            client_ip=_ip_from_bytes(client_ip_raw) if client_ip_raw != b"\x00\x00\x00\x00" else "",
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EventNotification:
     """Scanner → client (UDP:55265), 48 bytes."""
     event_type: int = 0
     event_data: int = 0
 
     @classmethod
-    def unpack(cls, data: bytes) -> EventNotification:
-        if len(data) < 48 or data[4:8] != MAGIC:
+    def unpack(cls, data: bytes | memoryview) -> EventNotification:
+        if len(data) < EVENT_NOTIFICATION_SIZE:
+            raise ValueError("Not a VENS notification")
+        magic, etype, edata = _NOTIFICATION.unpack_from(data, 0)
+        if magic != MAGIC:
             raise ValueError("Not a VENS notification")
-        etype = struct.unpack_from("!I", data, 8)[0]
-        edata = struct.unpack_from("!I", data, 16)[0]
         return cls(event_type=etype, event_data=edata)
 
 
@@ -237,12 +281,12 @@ class EventNotification:
 # TCP control channel (port 53219) packets
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class WelcomePacket:
     """Server → client, 16 bytes. Sent at start of every TCP connection."""
 
     @classmethod
-    def unpack(cls, data: bytes) -> WelcomePacket:
+    def unpack(cls, data: bytes | memoryview) -> WelcomePacket:
         if len(data) < 16 or data[4:8] != MAGIC:
             raise ValueError("Not a VENS welcome")
         return cls()
@@ -252,25 +296,26 @@ class WelcomePacket:
         return 16
 
 
-@dataclass
-class ReleaseRequest:
+@dataclass(slots=True)
+class ReleaseRequest(_Request):
     """Client → server on control channel, 32 bytes."""
     token: bytes = b"\x00" * 8
     action: int = 1  # 0 = NORMAL (deregister), 1 = ENFORCE (register)
 
+    _TEMPLATE = (
+        _U32.pack(32) + MAGIC + _U32.pack(ControlCommand.RELEASE)
+        + bytes(20)
+    )
+
     def pack(self) -> bytes:
-        buf = bytearray(32)
-        struct.pack_into("!I", buf, 0, 32)
-        buf[4:8] = MAGIC
-        struct.pack_into("!I", buf, 8, ControlCommand.RELEASE)
-        struct.pack_into("!I", buf, 12, 0)
+        buf = bytearray(self._TEMPLATE)
         buf[16:24] = self.token
-        struct.pack_into("!I", buf, 24, self.action)
+        _U32.pack_into(buf, 24, self.action)
         return bytes(buf)
 
 
-@dataclass
-class ReserveRequest:
+@dataclass(slots=True)
+class ReserveRequest(_Request):
     """Client → server on control channel, 384 bytes."""
     token: bytes = b"\x00" * 8
     client_ip: str = ""
@@ -278,60 +323,60 @@ class ReserveRequest:
     identity: str = ""
     timestamp: datetime = field(default_factory=datetime.now)
 
+    # Header and constant config fields; the rest is patched per request
+    _TEMPLATE = (
+        _U32.pack(384) + MAGIC + _U32.pack(ControlCommand.RESERVE)
+        + bytes(20)
+        # config fields at offset 32
+        + _U32X3.pack(0x00040500, 0x00000001, 0x00000001)
+        + bytes(72)
+        + _U32.pack(0xFFFF8170)  # offset 116
+        + bytes(264)
+    )
+
     def pack(self) -> bytes:
-        buf = bytearray(384)
-        struct.pack_into("!I", buf, 0, 384)
-        buf[4:8] = MAGIC
-        struct.pack_into("!I", buf, 8, ControlCommand.RESERVE)
-        struct.pack_into("!I", buf, 12, 0)
+        buf = bytearray(self._TEMPLATE)
         buf[16:24] = self.token
-        # config fields
-        struct.pack_into("!I", buf, 32, 0x00040500)
-        struct.pack_into("!I", buf, 36, 0x00000001)
-        struct.pack_into("!I", buf, 40, 0x00000001)
         buf[44:48] = _ip_to_bytes(self.client_ip)
-        struct.pack_into("!H", buf, 48, 0)
-        struct.pack_into("!H", buf, 50, self.notify_port)
+        _U16.pack_into(buf, 50, self.notify_port)
         # identity string at offset 52 — pairing secret (max 48 bytes = SIZE_OF_PSW_BYTES in APK)
-        id_str = self.identity.encode("ascii") if self.identity else \
-            "".join(self.client_ip.split(".")).encode("ascii")
-        buf[52:52 + min(len(id_str), 48)] = id_str[:48]
+        id_str = (
+            self.identity.encode("ascii") if self.identity
+            else self.client_ip.replace(".", "").encode("ascii")
+        )[:48]
+        buf[52:52 + len(id_str)] = id_str
         # date/time at offset 100
         dt = self.timestamp
-        struct.pack_into("!H", buf, 100, dt.year)
-        struct.pack_into("!B", buf, 102, dt.month)
-        struct.pack_into("!B", buf, 103, dt.day)
-        struct.pack_into("!B", buf, 104, dt.hour)
-        struct.pack_into("!B", buf, 105, dt.minute)
-        struct.pack_into("!B", buf, 106, dt.second)
-        struct.pack_into("!I", buf, 116, 0xFFFF8170)
+        _DATETIME.pack_into(
+            buf, 100, dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second,
+        )
         return bytes(buf)
 
 
-@dataclass
-class GetWifiStatusRequest:
+@dataclass(slots=True)
+class GetWifiStatusRequest(_Request):
     """Client → server on control channel, 32 bytes."""
     token: bytes = b"\x00" * 8
 
+    _TEMPLATE = (
+        _U32.pack(32) + MAGIC + _U32.pack(ControlCommand.GET_WIFI_STATUS)
+        + bytes(20)
+    )
+
     def pack(self) -> bytes:
-        buf = bytearray(32)
-        struct.pack_into("!I", buf, 0, 32)
-        buf[4:8] = MAGIC
-        struct.pack_into("!I", buf, 8, ControlCommand.GET_WIFI_STATUS)
-        buf[16:24] = self.token
-        return bytes(buf)
+        return _with_token(self._TEMPLATE, self.token)
 
 
-@dataclass
+@dataclass(slots=True)
 class GetWifiStatusResponse:
     """Server → client on control channel, 32 bytes."""
     state: int = 0
 
     @classmethod
-    def unpack(cls, data: bytes) -> GetWifiStatusResponse:
+    def unpack(cls, data: bytes | memoryview) -> GetWifiStatusResponse:
         if len(data) < 32:
             raise ValueError("Status response too short")
-        state = struct.unpack_from("!I", data, 16)[0]
+        state = _U32.unpack_from(data, 16)[0]
         return cls(state=state)
 
 
@@ -339,24 +384,7 @@ class GetWifiStatusResponse:
 # TCP data channel (port 53218) packets
 # ---------------------------------------------------------------------------
 
-def _build_data_request(token: bytes, command: int, payload: bytes) -> bytes:
-    """Build a data channel request packet."""
-    length = 32 + len(payload)
-    buf = bytearray(length)
-    struct.pack_into("!I", buf, 0, length)
-    buf[4:8] = MAGIC
-    struct.pack_into("!I", buf, 8, 1)  # direction = client
-    struct.pack_into("!I", buf, 12, 0)
-    buf[16:24] = token
-    # bytes 24-31: reserved
-    struct.pack_into("!I", buf, 32, command)
-    buf[36:36 + len(payload) - 4] = payload[4:] if len(payload) > 4 else b""
-    # Actually, let's be more precise: the command is at offset 32,
-    # and payload follows from offset 36
-    return bytes(buf)
-
-
-@dataclass
+@dataclass(slots=True)
 class DataRequest:
     """Generic data channel request builder."""
     token: bytes = b"\x00" * 8
@@ -365,75 +393,180 @@ class DataRequest:
     def pack(self, params: bytes = b"") -> bytes:
         total = 32 + 4 + len(params)  # header(32) + command(4) + params
         buf = bytearray(total)
-        struct.pack_into("!I", buf, 0, total)
+        _U32.pack_into(buf, 0, total)
         buf[4:8] = MAGIC
-        struct.pack_into("!I", buf, 8, 1)  # direction = client
-        struct.pack_into("!I", buf, 12, 0)
+        _U32.pack_into(buf, 8, 1)  # direction = client
+        _U32.pack_into(buf, 12, 0)
         buf[16:24] = self.token
-        struct.pack_into("!I", buf, 32, self.command)
+        _U32.pack_into(buf, 32, self.command)
         if params:
             buf[36:36 + len(params)] = params
         return bytes(buf)
 
 
-@dataclass
-class GetDeviceInfoRequest:
+@dataclass(slots=True)
+class GetDeviceInfoRequest(_Request):
     """SCSI INQUIRY (EVPD) request for device identity."""
     token: bytes = b"\x00" * 8
 
+    _TEMPLATE = DataRequest(command=DataCommand.GET_SET).pack(_PARAMS7.pack(
+        0x00000060,  # data size
+        0x00000000,
+        0x00000000,
+        SCSI_OPCODE_INQUIRY << 24,  # CDB[0] = INQUIRY
+        0x60000000,  # response buffer size
+        0x00000000,
+        0x00000000,
+    ))
+
     def pack(self) -> bytes:
-        params = struct.pack(
-            "!IIIIIII",
-            0x00000060,  # data size
-            0x00000000,
-            0x00000000,
-            SCSI_OPCODE_INQUIRY << 24,  # CDB[0] = INQUIRY
-            0x60000000,  # response buffer size
-            0x00000000,
-            0x00000000,
-        )
-        return DataRequest(self.token, DataCommand.GET_SET).pack(params)
+        return _with_token(self._TEMPLATE, self.token)
 
 
-@dataclass
-class GetScanSettingsRequest:
+@dataclass(slots=True)
+class GetScanSettingsRequest(_Request):
     """cmd=0x06, sub=0xD8 — get current scan settings."""
     token: bytes = b"\x00" * 8
 
+    _TEMPLATE = DataRequest(command=DataCommand.GET_SET).pack(_PARAMS7.pack(
+        0x00000000,
+        0x00000000,
+        0x00000000,
+        0xD8000000,
+        0x00000000,
+        0x00000000,
+        0x00000000,
+    ))
+
     def pack(self) -> bytes:
-        params = struct.pack(
-            "!IIIIIII",
-            0x00000000,
-            0x00000000,
-            0x00000000,
-            0xD8000000,
-            0x00000000,
-            0x00000000,
-            0x00000000,
-        )
-        return DataRequest(self.token, DataCommand.GET_SET).pack(params)
+        return _with_token(self._TEMPLATE, self.token)
 
 
-@dataclass
-class GetScanParamsRequest:
+@dataclass(slots=True)
+class GetScanParamsRequest(_Request):
     """SCSI INQUIRY (EVPD) request for scanner capabilities/parameters."""
     token: bytes = b"\x00" * 8
 
+    _TEMPLATE = DataRequest(command=DataCommand.GET_SET).pack(_PARAMS7.pack(
+        0x00000090,
+        0x00000000,
+        0x00000000,
+        (SCSI_OPCODE_INQUIRY << 24) | 0x01F000,  # CDB: INQUIRY, EVPD=1, Page=0xF0
+        0x90000000,  # Allocation Length = 0x90 (144)
+        0x00000000,
+        0x00000000,
+    ))
+
     def pack(self) -> bytes:
-        params = struct.pack(
-            "!IIIIIII",
-            0x00000090,
-            0x00000000,
-            0x00000000,
-            (SCSI_OPCODE_INQUIRY << 24) | 0x01F000,  # CDB: INQUIRY, EVPD=1, Page=0xF0
-            0x90000000,  # Allocation Length = 0x90 (144)
-            0x00000000,
-            0x00000000,
-        )
-        return DataRequest(self.token, DataCommand.GET_SET).pack(params)
+        return _with_token(self._TEMPLATE, self.token)
+
+
+@functools.lru_cache(maxsize=None)
+def _scan_config_template(
+    color_mode: int,
+    quality: int,
+    paper_size: int,
+    duplex: bool,
+    bleed_through: bool,
+    multi_feed: bool,
+    blank_page_removal: bool,
+) -> bytes:
+    """Build the scan config SET packet for one combination of settings.
+
+    Only a limited number of combinations exist, so each is built once;
+    ScanConfig.pack() copies it and fills in the token and BW density.
+    """
+    is_bw = color_mode == ColorMode.BW
+    is_gray = color_mode == ColorMode.GRAY
+    auto_quality = quality == Quality.AUTO
+    is_full_auto = color_mode == ColorMode.AUTO and auto_quality
+    dpi = _QUALITY_DPI.get(quality, 0)
+    w, h = PAPER_DIMENSIONS.get(paper_size, PAPER_DIMENSIONS[PaperSize.AUTO])
+
+    # Config data (80 bytes for simplex/shared, 128 for duplex with explicit back)
+    config_size = 0x50  # 80 bytes — sufficient for all modes
+    if duplex and is_full_auto:
+        config_size = 0x80  # 128 bytes — includes explicit back side params
+
+    total = 64 + config_size
+    buf = bytearray(total)
+
+    # Standard data channel header (32 bytes)
+    _U32.pack_into(buf, 0, total)
+    buf[4:8] = MAGIC
+    _U32.pack_into(buf, 8, 1)  # direction = client
+    _U32.pack_into(buf, 32, DataCommand.GET_SET)
+
+    # GET_SET param header (offset 36-63)
+    _U32.pack_into(buf, 40, config_size)
+    _U32.pack_into(buf, 48, 0xD4000000)  # sub-command 0xD4
+    _U32.pack_into(buf, 52, config_size << 24)
+
+    # Config data starts at offset 64
+    c = 64  # config base offset
+
+    # +1: duplex
+    buf[c + 1] = 0x03 if duplex else 0x01
+    # +2, +3, +5: always 0x01
+    buf[c + 2] = 0x01
+    buf[c + 3] = 0x01
+    buf[c + 5] = 0x01
+    # +4: multi-feed detection
+    buf[c + 4] = 0xD0 if multi_feed else 0x80
+    # +6: multi-feed detection
+    buf[c + 6] = 0xC1 if multi_feed else 0xC0
+    # +7: auto color flag
+    buf[c + 7] = 0xC1 if is_full_auto else 0x80
+    # +8: blank page removal
+    buf[c + 8] = 0xE0 if blank_page_removal else 0x80
+    # +9: constant
+    buf[c + 9] = 0xC8
+    # +10: auto quality
+    buf[c + 10] = 0xA0 if auto_quality else 0x80
+    # +11: bleed-through
+    buf[c + 11] = 0xC0 if bleed_through else 0x80
+    # +12: constant
+    buf[c + 12] = 0x80
+
+    # Front side params
+    buf[c + 31] = 0x30
+    buf[c + 33] = 0x40 if is_bw else 0x10
+    _U16X2.pack_into(buf, c + 34, dpi, dpi)
+    # +38-40: color encoding
+    # Third byte is 0x09 for small paper (POSTCARD), 0x0B otherwise
+    _color_enc_tail = b"\x09" if paper_size == PaperSize.POSTCARD else b"\x0B"
+    if is_gray:
+        buf[c + 38:c + 41] = b"\x02\x82" + _color_enc_tail
+    elif is_bw:
+        buf[c + 38:c + 41] = b"\x00\x03\x00"
+    else:
+        buf[c + 38:c + 41] = b"\x05\x82" + _color_enc_tail
+    # +44-45, +48-49: paper size
+    _U16.pack_into(buf, c + 44, w)
+    _U16.pack_into(buf, c + 48, h)
+    # +50: constant
+    buf[c + 50] = 0x04
+    # +54-56: constants
+    buf[c + 54:c + 57] = b"\x01\x01\x01"
+    # +57: BW flag
+    buf[c + 57] = 0x01 if is_bw else 0x00
+
+    # Back side params (only for full-auto duplex, explicit 128B config)
+    if config_size == 0x80:
+        bc = c + 80  # back config offset
+        buf[bc + 0] = 0x01
+        buf[bc + 1] = 0x10
+        _U16X2.pack_into(buf, bc + 2, dpi, dpi)
+        buf[bc + 6:bc + 9] = b"\x02\x82\x0B"
+        _U16.pack_into(buf, bc + 12, w)
+        _U16.pack_into(buf, bc + 16, h)
+        buf[bc + 18] = 0x04
+        buf[bc + 22:bc + 25] = b"\x01\x01\x01"
 
+    return bytes(buf)
 
-@dataclass
+
+@dataclass(slots=True)
 class ScanConfig:
     """Scan configuration for SET command.
 
@@ -482,112 +615,25 @@ class ScanConfig:
 
     def pack(self, token: bytes) -> bytes:
         """Build the scan config SET packet (cmd=0x06, sub=0xD4)."""
-        is_bw = self.color_mode == ColorMode.BW
-        is_gray = self.color_mode == ColorMode.GRAY
-        is_auto_color = self.color_mode == ColorMode.AUTO
-        is_auto_quality = self.quality == Quality.AUTO
-        is_full_auto = is_auto_color and is_auto_quality
-        dpi = _QUALITY_DPI.get(self.quality, 0)
-        w, h = PAPER_DIMENSIONS.get(self.paper_size, PAPER_DIMENSIONS[PaperSize.AUTO])
-
-        # Config data (80 bytes for simplex/shared, 128 for duplex with explicit back)
-        config_size = 0x50  # 80 bytes — sufficient for all modes
-        if self.duplex and is_full_auto:
-            config_size = 0x80  # 128 bytes — includes explicit back side params
-
-        total = 64 + config_size
-        buf = bytearray(total)
-
-        # Standard data channel header (32 bytes)
-        struct.pack_into("!I", buf, 0, total)
-        buf[4:8] = MAGIC
-        struct.pack_into("!I", buf, 8, 1)  # direction = client
+        buf = bytearray(_scan_config_template(
+            self.color_mode, self.quality, self.paper_size, bool(self.duplex),
+            bool(self.bleed_through), bool(self.multi_feed),
+            bool(self.blank_page_removal),
+        ))
         buf[16:24] = token
-        struct.pack_into("!I", buf, 32, DataCommand.GET_SET)
-
-        # GET_SET param header (offset 36-63)
-        struct.pack_into("!I", buf, 40, config_size)
-        struct.pack_into("!I", buf, 48, 0xD4000000)  # sub-command 0xD4
-        struct.pack_into("!I", buf, 52, config_size << 24)
-
-        # Config data starts at offset 64
-        c = 64  # config base offset
-
-        # +1: duplex
-        buf[c + 1] = 0x03 if self.duplex else 0x01
-        # +2, +3, +5: always 0x01
-        buf[c + 2] = 0x01
-        buf[c + 3] = 0x01
-        buf[c + 5] = 0x01
-        # +4: multi-feed detection
-        buf[c + 4] = 0xD0 if self.multi_feed else 0x80
-        # +6: multi-feed detection
-        buf[c + 6] = 0xC1 if self.multi_feed else 0xC0
-        # +7: auto color flag
-        buf[c + 7] = 0xC1 if is_auto_color and is_auto_quality else 0x80
-        # +8: blank page removal
-        buf[c + 8] = 0xE0 if self.blank_page_removal else 0x80
-        # +9: constant
-        buf[c + 9] = 0xC8
-        # +10: auto quality
-        buf[c + 10] = 0xA0 if is_auto_quality else 0x80
-        # +11: bleed-through
-        buf[c + 11] = 0xC0 if self.bleed_through else 0x80
-        # +12: constant
-        buf[c + 12] = 0x80
-
-        # Front side params
-        buf[c + 31] = 0x30
-        buf[c + 33] = 0x40 if is_bw else 0x10
-        struct.pack_into("!HH", buf, c + 34, dpi, dpi)
-        # +38-40: color encoding
-        # Third byte is 0x09 for small paper (POSTCARD), 0x0B otherwise
-        _color_enc_tail = b"\x09" if self.paper_size == PaperSize.POSTCARD else b"\x0B"
-        if is_gray:
-            buf[c + 38:c + 41] = b"\x02\x82" + _color_enc_tail
-        elif is_bw:
-            buf[c + 38:c + 41] = b"\x00\x03\x00"
-        else:
-            buf[c + 38:c + 41] = b"\x05\x82" + _color_enc_tail
-        # +44-45, +48-49: paper size
-        struct.pack_into("!H", buf, c + 44, w)
-        struct.pack_into("!H", buf, c + 48, h)
-        # +50: constant
-        buf[c + 50] = 0x04
-        # +54-56: constants
-        buf[c + 54:c + 57] = b"\x01\x01\x01"
-        # +57: BW flag
-        buf[c + 57] = 0x01 if is_bw else 0x00
         # +60: BW density value
-        if is_bw:
-            buf[c + 60] = 0x06 + self.bw_density
-
-        # Back side params (only for full-auto duplex, explicit 128B config)
-        if config_size == 0x80:
-            bc = c + 80  # back config offset
-            buf[bc + 0] = 0x01
-            buf[bc + 1] = 0x10
-            struct.pack_into("!HH", buf, bc + 2, dpi, dpi)
-            buf[bc + 6:bc + 9] = b"\x02\x82\x0B"
-            struct.pack_into("!H", buf, bc + 12, w)
-            struct.pack_into("!H", buf, bc + 16, h)
-            buf[bc + 18] = 0x04
-            buf[bc + 22:bc + 25] = b"\x01\x01\x01"
-
+        if self.color_mode == ColorMode.BW:
+            buf[64 + 60] = 0x06 + self.bw_density
         return bytes(buf)
 
     @classmethod
-    def unpack(cls, data: bytes) -> ScanConfig:
+    def unpack(cls, data: bytes | memoryview) -> ScanConfig:
         """Decode ScanConfig from raw config bytes (starting at config data, packet offset 64)."""
         duplex = data[1] == 0x03
 
         # Quality from resolution
-        dpi = struct.unpack_from("!H", data, 34)[0]
-        quality = Quality.AUTO
-        for q, d in _QUALITY_DPI.items():
-            if d == dpi:
-                quality = q
-                break
+        dpi = _U16.unpack_from(data, 34)[0]
+        quality = _DPI_TO_QUALITY.get(dpi, Quality.AUTO)
 
         # Color mode
         color_enc = data[38:41]
@@ -603,13 +649,9 @@ class ScanConfig:
         bleed_through = data[11] == 0xC0
 
         # Paper size from dimensions
-        w = struct.unpack_from("!H", data, 44)[0]
-        h = struct.unpack_from("!H", data, 48)[0]
-        paper_size = PaperSize.AUTO
-        for ps, (pw, ph) in PAPER_DIMENSIONS.items():
-            if pw == w and ph == h:
-                paper_size = ps
-                break
+        w = _U16.unpack_from(data, 44)[0]
+        h = _U16.unpack_from(data, 48)[0]
+        paper_size = _DIMS_TO_PAPER.get((w, h), PaperSize.AUTO)
 
         bw_density = max(0, data[60] - 6) if color_mode == ColorMode.BW else 0
         multi_feed = data[4] == 0xD0
@@ -649,127 +691,125 @@ _BLEED_THROUGH_LUT = bytes.fromhex(
 )
 
 
-@dataclass
-class WriteToneCurveRequest:
+@dataclass(slots=True)
+class WriteToneCurveRequest(_Request):
     """cmd=0x08, sub=0xDB — write tone curve for bleed-through reduction."""
     token: bytes = b"\x00" * 8
 
+    _TEMPLATE = DataRequest(command=DataCommand.CONFIG).pack(_PARAMS7.pack(
+        0x00000000,
+        0x0000010A,   # input param length = 266
+        0x00000000,
+        0xDB850000,   # sub-command 0xDB
+        0x00010A00,
+        0x00000000,
+        0x00000000,
+    ) + bytes.fromhex("00001000010001000000") + _BLEED_THROUGH_LUT)
+
     def pack(self) -> bytes:
-        tone_header = bytes.fromhex("00001000010001000000")
-        tone_data = tone_header + _BLEED_THROUGH_LUT
-        params = struct.pack(
-            "!IIIIIII",
-            0x00000000,
-            0x0000010A,   # input param length = 266
-            0x00000000,
-            0xDB850000,   # sub-command 0xDB
-            0x00010A00,
-            0x00000000,
-            0x00000000,
-        ) + tone_data
-        return DataRequest(self.token, DataCommand.CONFIG).pack(params)
-
-
-@dataclass
-class ConfigRequest:
+        return _with_token(self._TEMPLATE, self.token)
+
+
+@dataclass(slots=True)
+class ConfigRequest(_Request):
     """cmd=0x08 — scanner config."""
     token: bytes = b"\x00" * 8
 
+    _TEMPLATE = DataRequest(command=DataCommand.CONFIG).pack(_PARAMS8.pack(
+        0x00000000,
+        0x00000004,
+        0x00000000,
+        0xEB000000,
+        0x00040000,
+        0x00000000,
+        0x00000000,
+        0x05010000,
+    ))
+
     def pack(self) -> bytes:
-        params = struct.pack(
-            "!IIIIIIII",
-            0x00000000,
-            0x00000004,
-            0x00000000,
-            0xEB000000,
-            0x00040000,
-            0x00000000,
-            0x00000000,
-            0x05010000,
-        )
-        return DataRequest(self.token, DataCommand.CONFIG).pack(params)
+        return _with_token(self._TEMPLATE, self.token)
 
 
-@dataclass
-class GetStatusRequest:
+@dataclass(slots=True)
+class GetStatusRequest(_Request):
     """cmd=0x0A — get scan status."""
     token: bytes = b"\x00" * 8
 
+    _TEMPLATE = DataRequest(command=DataCommand.GET_STATUS).pack(_PARAMS7.pack(
+        0x00000020,
+        0x00000000,
+        0x00000000,
+        0xC2000000,
+        0x00000000,
+        0x20000000,
+        0x00000000,
+    ))
+
     def pack(self) -> bytes:
-        params = struct.pack(
-            "!IIIIIII",
-            0x00000020,
-            0x00000000,
-            0x00000000,
-            0xC2000000,
-            0x00000000,
-            0x20000000,
-            0x00000000,
-        )
-        return DataRequest(self.token, DataCommand.GET_STATUS).pack(params)
+        return _with_token(self._TEMPLATE, self.token)
 
 
-@dataclass
-class PrepareScanRequest:
+@dataclass(slots=True)
+class PrepareScanRequest(_Request):
     """cmd=0x06, sub=0xD5 — prepare scanner for scanning (72 bytes total)."""
     token: bytes = b"\x00" * 8
 
+    _TEMPLATE = DataRequest(command=DataCommand.GET_SET).pack(_PARAMS9.pack(
+        0x00000008,
+        0x00000008,
+        0x00000000,
+        0xD5000000,
+        0x08080000,
+        0x00000000,
+        0x00000000,
+        0x00000000,
+        0x00000000,
+    ))
+
     def pack(self) -> bytes:
-        params = struct.pack(
-            "!IIIIIIIII",
-            0x00000008,
-            0x00000008,
-            0x00000000,
-            0xD5000000,
-            0x08080000,
-            0x00000000,
-            0x00000000,
-            0x00000000,
-            0x00000000,
-        )
-        return DataRequest(self.token, DataCommand.GET_SET).pack(params)
+        return _with_token(self._TEMPLATE, self.token)
 
 
-@dataclass
-class WaitForScanRequest:
+@dataclass(slots=True)
+class WaitForScanRequest(_Request):
     """cmd=0x06, sub=0xE0 — wait for scan to start (blocks until button press)."""
     token: bytes = b"\x00" * 8
 
+    _TEMPLATE = DataRequest(command=DataCommand.GET_SET).pack(_PARAMS7.pack(
+        0x00000000,
+        0x00000000,
+        0x00000000,
+        0xE0000000,
+        0x00000000,
+        0x00000000,
+        0x00000000,
+    ))
+
     def pack(self) -> bytes:
-        params = struct.pack(
-            "!IIIIIII",
-            0x00000000,
-            0x00000000,
-            0x00000000,
-            0xE0000000,
-            0x00000000,
-            0x00000000,
-            0x00000000,
-        )
-        return DataRequest(self.token, DataCommand.GET_SET).pack(params)
+        return _with_token(self._TEMPLATE, self.token)
 
 
-@dataclass
-class EndScanRequest:
+@dataclass(slots=True)
+class EndScanRequest(_Request):
     """cmd=0x06, sub=0xD6 — end/cancel scan session."""
     token: bytes = b"\x00" * 8
 
+    _TEMPLATE = DataRequest(command=DataCommand.GET_SET).pack(_PARAMS7.pack(
+        0x00000000,
+        0x00000000,
+        0x00000000,
+        0xD6000000,
+        0x00000000,
+        0x00000000,
+        0x00000000,
+    ))
+
     def pack(self) -> bytes:
-        params = struct.pack(
-            "!IIIIIII",
-            0x00000000,
-            0x00000000,
-            0x00000000,
-            0xD6000000,
-            0x00000000,
-            0x00000000,
-            0x00000000,
-        )
-        return DataRequest(self.token, DataCommand.GET_SET).pack(params)
+        return _with_token(self._TEMPLATE, self.token)
 
 
-@dataclass
-class PageTransferRequest:
+@dataclass(slots=True)
+class PageTransferRequest(_Request):
     """SCSI READ(10) page transfer request (§6.2).
 
     Each chunk request transfers up to 256KB of JPEG data.
@@ -781,52 +821,58 @@ class PageTransferRequest:
     chunk: int = 0
     back_side: bool = False  # True for back side in duplex mode
 
-    def pack(self) -> bytes:
-        # SCSI CDB: 12 bytes per §6.2
-        cdb = bytearray(12)
-        cdb[0] = SCSI_OPCODE_READ10        # Opcode
-        # cdb[1] = 0x00                     # Reserved
-        # cdb[2] = 0x00                     # Data Type: IMAGE
-        cdb[3] = 0x02                       # Transfer Mode: BLOCK_UNTIL_AVAIL
-        # cdb[4] = 0x00                     # Reserved
-        cdb[5] = 0x80 if self.back_side else 0x00  # Front/Back
+    # SCSI CDB: 12 bytes per §6.2, at packet offset 48.  Front side,
+    # Page ID and Sequence ID are patched per request.
+    _CDB = bytes([
+        SCSI_OPCODE_READ10,             # Opcode
+        0x00,                           # Reserved
+        0x00,                           # Data Type: IMAGE
+        0x02,                           # Transfer Mode: BLOCK_UNTIL_AVAIL
+        0x00,                           # Reserved
+        0x00,                           # Front/Back
         # Transfer Length: 24-bit big-endian
-        cdb[6] = (PAGE_TRANSFER_LEN >> 16) & 0xFF
-        cdb[7] = (PAGE_TRANSFER_LEN >> 8) & 0xFF
-        cdb[8] = PAGE_TRANSFER_LEN & 0xFF
-        # cdb[9] = 0x00                     # Reserved
-        cdb[10] = self.sheet                # Page ID
-        cdb[11] = self.chunk                # Sequence ID
-
-        params = struct.pack(
-            "!III",
-            PAGE_TRANSFER_LEN,  # Allocation Length
-            0x00000000,
-            0x00000000,
-        ) + bytes(cdb) + struct.pack("!I", 0x00000000)
-        return DataRequest(self.token, DataCommand.PAGE_TRANSFER).pack(params)
-
-
-@dataclass
-class GetPageMetadataRequest:
+        (PAGE_TRANSFER_LEN >> 16) & 0xFF,
+        (PAGE_TRANSFER_LEN >> 8) & 0xFF,
+        PAGE_TRANSFER_LEN & 0xFF,
+        0x00,                           # Reserved
+        0x00,                           # Page ID
+        0x00,                           # Sequence ID
+    ])
+    _TEMPLATE = DataRequest(command=DataCommand.PAGE_TRANSFER).pack(_U32X3.pack(
+        PAGE_TRANSFER_LEN,  # Allocation Length
+        0x00000000,
+        0x00000000,
+    ) + _CDB + b"\x00\x00\x00\x00")
+
+    def pack(self) -> bytes:
+        buf = bytearray(self._TEMPLATE)
+        buf[16:24] = self.token
+        buf[53] = 0x80 if self.back_side else 0x00  # CDB[5]: Front/Back
+        buf[58] = self.sheet                        # CDB[10]: Page ID
+        buf[59] = self.chunk                        # CDB[11]: Sequence ID
+        return bytes(buf)
+
+
+@dataclass(slots=True)
+class GetPageMetadataRequest(_Request):
     """SCSI REQUEST SENSE request for page metadata after transfer."""
     token: bytes = b"\x00" * 8
 
+    _TEMPLATE = DataRequest(command=DataCommand.GET_SET).pack(_PARAMS7.pack(
+        0x00000012,  # Allocation Length = 18
+        0x00000000,
+        0x00000000,
+        SCSI_OPCODE_REQUEST_SENSE << 24,  # CDB[0] = REQUEST SENSE
+        0x12000000,  # CDB[4] = Allocation Length (18)
+        0x00000000,
+        0x00000000,
+    ))
+
     def pack(self) -> bytes:
-        params = struct.pack(
-            "!IIIIIII",
-            0x00000012,  # Allocation Length = 18
-            0x00000000,
-            0x00000000,
-            SCSI_OPCODE_REQUEST_SENSE << 24,  # CDB[0] = REQUEST SENSE
-            0x12000000,  # CDB[4] = Allocation Length (18)
-            0x00000000,
-            0x00000000,
-        )
-        return DataRequest(self.token, DataCommand.GET_SET).pack(params)
+        return _with_token(self._TEMPLATE, self.token)
 
 
-@dataclass
+@dataclass(slots=True)
 class PageHeader:
     """Response header before JPEG data, 42 bytes.
 
@@ -843,13 +889,12 @@ class PageHeader:
         return max(0, self.total_length - 42)
 
     @classmethod
-    def unpack(cls, data: bytes) -> PageHeader:
-        if len(data) < 42 or data[4:8] != MAGIC:
+    def unpack(cls, data: bytes | memoryview) -> PageHeader:
+        if len(data) < 42:
+            raise ValueError("Not a page header")
+        total_length, magic, page_type, sheet, side = _PAGE_HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
             raise ValueError("Not a page header")
-        total_length = struct.unpack_from("!I", data, 0)[0]
-        page_type = struct.unpack_from("!I", data, 12)[0]
-        sheet = data[40]
-        side = data[41]
         return cls(
             total_length=total_length, page_type=page_type,
             sheet=sheet, side=side,
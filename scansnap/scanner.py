@@ -3,17 +3,174 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import contextvars
+import json
 import logging
 import os
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Iterator
 from pathlib import Path
+from typing import Any, BinaryIO
 
-from scansnap.packets import CLIENT_NOTIFY_PORT, ColorMode, ScanConfig
+from scansnap.packets import (
+    CLIENT_NOTIFY_PORT, ColorMode, DeviceInfo, ScanConfig, new_token,
+)
 from scansnap.data import DataChannel
 from scansnap.discovery import ScanSnapDiscovery
 from scansnap.session import ControlSession
 
 log = logging.getLogger(__name__)
 
+# Source of retry jitter, so clients retrying at once don't stay in lockstep
+_retry_rng = random.Random()
+
+# Loop time after which retries give up instead of sleeping again; shared
+# by all retried requests of one connect() or pair()
+_retry_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "_retry_deadline", default=None,
+)
+_CONNECT_RETRY_BUDGET = 15.0
+
+
+@contextlib.contextmanager
+def _retry_budget(seconds: float) -> Iterator[None]:
+    """Limit the total time retried requests may spend backing off."""
+    token = _retry_deadline.set(asyncio.get_running_loop().time() + seconds)
+    try:
+        yield
+    finally:
+        _retry_deadline.reset(token)
+
+
+# Last known scanner addresses, keyed by serial number.  Discovery itself
+# can't be skipped (it announces the session token), but the most recently
+# seen address is probed directly before falling back to a broadcast.
+_DISCOVERY_CACHE_TTL = 7 * 24 * 3600
+_CACHED_PROBE_TIMEOUT = 2.0
+
+# Page chunks queued for the file writer before the scan loop waits on disk
+_WRITE_QUEUE_SIZE = 32
+
+# Scanned pages iter_pages() buffers ahead of its consumer; once full, the
+# scan loop waits before transferring the next page
+_PAGE_QUEUE_SIZE = 2
+
+# Longest wait for the first heartbeat ACK before carrying on regardless
+_HEARTBEAT_ACK_TIMEOUT = 0.3
+
+
+def _discovery_cache_path() -> Path:
+    # Resolved on use, as Path.home() raises RuntimeError where there is no
+    # home directory
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "airscap" / "scanners.json"
+
+
+def _load_discovery_cache() -> dict[str, dict[str, Any]]:
+    try:
+        cache = json.loads(_discovery_cache_path().read_text())
+    except (OSError, RuntimeError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    # Only entries keyed by their own serial (older files were keyed otherwise)
+    return {
+        k: v for k, v in cache.items()
+        if isinstance(v, dict) and v.get("serial") == k
+    }
+
+
+def _save_discovery_cache(info: DeviceInfo) -> None:
+    cache = _load_discovery_cache()
+    cache[info.serial] = {
+        "host": info.device_ip,
+        "data_port": info.data_port,
+        "control_port": info.control_port,
+        "serial": info.serial,
+        "name": info.name,
+        "last_seen": time.time(),
+    }
+    try:
+        path = _discovery_cache_path()
+        tmp = path.with_suffix(".tmp")
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Readable by the owner only; replaced atomically
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp, path)
+    except (OSError, RuntimeError) as e:
+        log.debug("Cannot save discovery cache: %s", e)
+
+
+def _last_seen_host() -> str | None:
+    """Return the most recently seen scanner address, if still fresh."""
+    entries = [
+        e for e in _load_discovery_cache().values()
+        if time.time() - e.get("last_seen", 0) < _DISCOVERY_CACHE_TTL
+    ]
+    if not entries:
+        return None
+    return max(entries, key=lambda e: e.get("last_seen", 0)).get("host")
+
+
+async def _find_scanner(
+    discovery: ScanSnapDiscovery,
+    scanner_ip: str | None,
+    token: bytes,
+    timeout: float,
+) -> DeviceInfo:
+    """Discover a scanner, probing the last known address first.
+
+    The probe counts against *timeout*; the broadcast gets what is left.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    if scanner_ip is None:
+        host = await asyncio.to_thread(_last_seen_host)
+        if host:
+            log.info("Trying last known scanner address %s...", host)
+            try:
+                info = await discovery.find_scanner(
+                    scanner_ip=host, token=token,
+                    timeout=min(timeout, _CACHED_PROBE_TIMEOUT),
+                )
+            except (asyncio.TimeoutError, OSError):
+                log.info("No reply from %s, falling back to broadcast", host)
+            else:
+                await asyncio.to_thread(_save_discovery_cache, info)
+                return info
+    info = await discovery.find_scanner(
+        scanner_ip=scanner_ip, token=token,
+        timeout=max(0.0, deadline - loop.time()),
+    )
+    await asyncio.to_thread(_save_discovery_cache, info)
+    return info
+
+
+async def _gather(*aws: Awaitable[Any]) -> list[Any]:
+    """Run awaitables concurrently, like asyncio.gather().
+
+    If one fails, the others are cancelled and awaited before its
+    exception is re-raised, so none is left running with an unretrieved
+    error.  Unlike a TaskGroup, the original exception type is kept.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _identity_offsets(key: str, shift: int) -> tuple[int, ...]:
+    """Return ord(key[i]) + shift for each password position."""
+    return tuple(ord(k) + shift for k in key)
+
 
 class Scanner:
     """High-level interface for ScanSnap operations.
@@ -36,15 +193,22 @@ class Scanner:
         control_port: int = 53219,
         token: bytes | None = None,
         identity: str = "",
+        keep_control_open: bool = False,
+        discovery: ScanSnapDiscovery | None = None,
     ) -> None:
         self.host = host
         self.data_port = data_port
         self.control_port = control_port
-        self.token = token or os.urandom(6) + b"\x00\x00"
+        self.token = token or new_token()
         self.identity = identity
-        self._control = ControlSession(host, control_port)
-        self._discovery = ScanSnapDiscovery()
+        self._control = ControlSession(
+            host, control_port, keep_alive=keep_control_open,
+        )
+        self._discovery = discovery or ScanSnapDiscovery()
         self._local_ip = self._discovery.local_ip
+        self._data: DataChannel | None = None
+        self._discovered = False
+        self._discovery_task: asyncio.Task[None] | None = None
         self._connected = False
 
     # Identity derivation constants.
@@ -52,6 +216,7 @@ class Scanner:
     #   identity[i] = ord(password[i]) + ord(KEY[i]) + SHIFT
     _IDENTITY_KEY = "pFusCANsNapFiPfu"
     _IDENTITY_SHIFT = 11
+    _IDENTITY_OFFSETS = _identity_offsets(_IDENTITY_KEY, _IDENTITY_SHIFT)
 
     @staticmethod
     def password_from_serial(serial: str) -> str:
@@ -66,14 +231,13 @@ class Scanner:
     @classmethod
     def compute_identity(cls, password: str) -> str:
         """Compute pairing identity from a password."""
-        key = cls._IDENTITY_KEY
-        if len(password) > len(key):
+        offsets = cls._IDENTITY_OFFSETS
+        if len(password) > len(offsets):
             raise ValueError(
-                f"Password too long (max {len(key)} chars, got {len(password)})"
+                f"Password too long (max {len(offsets)} chars, got {len(password)})"
             )
         return "".join(
-            str(ord(c) + ord(key[i]) + cls._IDENTITY_SHIFT)
-            for i, c in enumerate(password)
+            str(ord(c) + offset) for c, offset in zip(password, offsets)
         )
 
     @classmethod
@@ -101,10 +265,8 @@ class Scanner:
 
         # Step 1: UDP discovery
         discovery = ScanSnapDiscovery()
-        token = os.urandom(6) + b"\x00\x00"
-        info = await discovery.find_scanner(
-            scanner_ip=scanner_ip, token=token, timeout=timeout,
-        )
+        token = new_token()
+        info = await _find_scanner(discovery, scanner_ip, token, timeout)
         log.info("Discovered: %s (%s) at %s", info.name, info.serial, info.device_ip)
 
         # Auto-derive password from serial if neither password nor identity given
@@ -119,30 +281,44 @@ class Scanner:
             control_port=info.control_port,
             token=token,
             identity=identity,
+            discovery=discovery,
         )
         scanner._discovered = True
-        scanner._discovery = discovery
-
-        # Step 2: ReserveRequest with identity — check acceptance
-        accepted = await scanner._control.try_configure(
-            token, scanner._local_ip, CLIENT_NOTIFY_PORT, identity=identity,
-        )
-        if not accepted:
-            await discovery.stop_heartbeat()
-            raise ValueError("Pairing rejected — wrong password")
 
-        # Step 3: Start heartbeats
-        await discovery.start_heartbeat(info.device_ip, token)
-        await asyncio.sleep(0.3)
-
-        # Step 4: Data channel setup (same as connect)
-        data_ch = DataChannel(info.device_ip, info.data_port, token)
-        await scanner._data_request_with_retry(data_ch.get_device_info)
-        await scanner._data_request_with_retry(data_ch.get_scan_params)
+        with _retry_budget(_CONNECT_RETRY_BUDGET):
+            # Step 2: ReserveRequest with identity — check acceptance
+            accepted = await scanner._data_request_with_retry(
+                lambda: scanner._control.try_configure(
+                    token, scanner._local_ip, CLIENT_NOTIFY_PORT, identity=identity,
+                ),
+            )
+            if not accepted:
+                await discovery.stop_heartbeat()
+                raise ValueError("Pairing rejected — wrong password")
+
+            # Step 3: Start heartbeats
+            await discovery.start_heartbeat(info.device_ip, token)
+            await scanner._wait_heartbeat_ack()
+
+            # Step 4: Data channel setup (same as connect), overlapped with
+            # Step 5's control channel status check — the channels are independent
+            data_ch = await scanner._get_data_channel()
+
+            async def data_setup() -> None:
+                await scanner._data_request_with_retry(data_ch.get_device_info)
+                await scanner._data_request_with_retry(data_ch.get_scan_params)
+
+            await _gather(
+                data_setup(),
+                scanner._data_request_with_retry(
+                    lambda: scanner._control.check_status(token),
+                ),
+            )
 
-        # Step 5: Control channel — status check + register
-        await scanner._control.check_status(token)
-        await scanner._control.register(token)
+            # Step 5: Control channel — register
+            await scanner._data_request_with_retry(
+                lambda: scanner._control.register(token),
+            )
 
         scanner._connected = True
         log.info("Pairing complete! identity=%s", identity)
@@ -158,10 +334,8 @@ class Scanner:
     ) -> Scanner:
         """Discover a scanner and create a Scanner instance."""
         discovery = ScanSnapDiscovery()
-        token = os.urandom(6) + b"\x00\x00"
-        info = await discovery.find_scanner(
-            scanner_ip=scanner_ip, token=token, timeout=timeout,
-        )
+        token = new_token()
+        info = await _find_scanner(discovery, scanner_ip, token, timeout)
         log.info("Discovered: %s (%s)", info.name, info.serial)
         scanner = cls(
             host=info.device_ip,
@@ -169,68 +343,133 @@ class Scanner:
             control_port=info.control_port,
             token=token,
             identity=identity,
+            discovery=discovery,
         )
         scanner._discovered = True
         return scanner
 
     async def _ensure_discovered(self) -> None:
-        """Make sure we've sent UDP discovery so the scanner knows our token."""
-        if getattr(self, "_discovered", False):
+        """Make sure we've sent UDP discovery so the scanner knows our token.
+
+        Concurrent callers share the discovery already in flight instead of
+        each broadcasting their own.
+        """
+        if self._discovered:
             return
-        log.info("Sending UDP discovery to %s...", self.host)
-        info = await self._discovery.find_scanner(
-            scanner_ip=self.host, token=self.token, timeout=10,
-        )
-        log.info("Discovery OK: %s (%s)", info.name, info.serial)
-        self._discovered = True
+        task = self._discovery_task
+        if task is None:
+            task = self._discovery_task = asyncio.create_task(self._run_discovery())
+        await asyncio.shield(task)
+
+    async def _run_discovery(self) -> None:
+        try:
+            log.info("Sending UDP discovery to %s...", self.host)
+            info = await self._discovery.find_scanner(
+                scanner_ip=self.host, token=self.token, timeout=10,
+            )
+            log.info("Discovery OK: %s (%s)", info.name, info.serial)
+            self._discovered = True
+        finally:
+            self._discovery_task = None
+
+    async def _wait_heartbeat_ack(self) -> None:
+        """Wait until the scanner has seen our heartbeats.
+
+        Returns on the first heartbeat ACK, or after a short timeout for
+        scanners that don't acknowledge them.
+        """
+        try:
+            await asyncio.wait_for(
+                self._discovery.heartbeat_ready.wait(), _HEARTBEAT_ACK_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            log.debug("No heartbeat ACK, continuing")
+
+    async def _get_data_channel(self) -> DataChannel:
+        """Return the data channel, reusing it (and its idle connections).
+
+        A new channel is created if the host, port or token has changed.
+        """
+        data = self._data
+        if data is not None and (data.host, data.port, data.token) == (
+            self.host, self.data_port, self.token,
+        ):
+            return data
+        if data is not None:
+            await data.aclose()
+        data = self._data = DataChannel(self.host, self.data_port, self.token)
+        return data
 
     async def _data_request_with_retry(
-        self, coro_factory, retries: int = 3, delay: float = 2.0,
+        self, coro_factory, retries: int = 4, base: float = 0.5, cap: float = 4.0,
+        deadline: float | None = None,
     ):
-        """Run a data channel coroutine with retry on connection failure."""
+        """Run a scanner request coroutine with retry on connection failure.
+
+        Retries back off exponentially with full jitter: before retry n the
+        delay is uniform in [0, min(cap, base * 2**n)].  The last error is
+        raised as soon as a delay would end past *deadline* (in loop time),
+        or past the surrounding connect()/pair() budget.
+        """
+        shared = _retry_deadline.get()
+        if deadline is None or (shared is not None and shared < deadline):
+            deadline = shared
+        loop = asyncio.get_running_loop()
         for attempt in range(retries):
             try:
                 return await coro_factory()
             except (ConnectionError, OSError) as e:
                 if attempt == retries - 1:
                     raise
+                delay = _retry_rng.uniform(0, min(cap, base * 2 ** attempt))
+                if deadline is not None and loop.time() + delay > deadline:
+                    log.warning("Connection error: %s — retry budget exhausted", e)
+                    raise
                 log.warning(
-                    "Data channel error (attempt %d/%d): %s — retrying in %.1fs",
+                    "Connection error (attempt %d/%d): %s — retrying in %.1fs",
                     attempt + 1, retries, e, delay,
                 )
                 await asyncio.sleep(delay)
 
     async def connect(self) -> None:
         """Establish session with the scanner."""
-        await self._ensure_discovered()
+        with _retry_budget(_CONNECT_RETRY_BUDGET):
+            await self._ensure_discovered()
 
-        # Start heartbeats to keep session alive
-        await self._discovery.start_heartbeat(self.host, self.token)
+            # Start heartbeats to keep session alive
+            await self._discovery.start_heartbeat(self.host, self.token)
 
-        # Give the scanner a moment to register our heartbeats
-        await asyncio.sleep(0.3)
+            # Give the scanner a moment to register our heartbeats
+            await self._wait_heartbeat_ack()
 
-        # Configure session on control channel
-        await self._control.configure(
-            self.token, self._local_ip, CLIENT_NOTIFY_PORT,
-            identity=self.identity,
-        )
-        log.info("Session configured")
-
-        # Setup on data channel (with retry for flaky connections)
-        data_ch = DataChannel(self.host, self.data_port, self.token)
-
-        await self._data_request_with_retry(data_ch.get_device_info)
-        log.info("Device info OK")
-
-        status = await self._control.check_status(self.token)
-        log.info("Status: state=%d", status.state)
+            # Configure session on control channel
+            await self._data_request_with_retry(
+                lambda: self._control.configure(
+                    self.token, self._local_ip, CLIENT_NOTIFY_PORT,
+                    identity=self.identity,
+                ),
+            )
+            log.info("Session configured")
+
+            # Setup on data channel (with retry for flaky connections)
+            data_ch = await self._get_data_channel()
+
+            # Device info (data channel) and status (control channel) don't
+            # depend on each other
+            _, status = await _gather(
+                self._data_request_with_retry(data_ch.get_device_info),
+                self._data_request_with_retry(
+                    lambda: self._control.check_status(self.token),
+                ),
+            )
+            log.info("Device info OK")
+            log.info("Status: state=%d", status.state)
 
-        await self._data_request_with_retry(data_ch.get_scan_params)
-        log.info("Scan params OK")
+            await self._data_request_with_retry(data_ch.get_scan_params)
+            log.info("Scan params OK")
 
-        await self._data_request_with_retry(data_ch.set_config)
-        log.info("Config OK")
+            await self._data_request_with_retry(data_ch.set_config)
+            log.info("Config OK")
 
         self._connected = True
 
@@ -248,6 +487,20 @@ class Scanner:
         Returns list of (sheet, side, jpeg_data) tuples.
         Empty pages (0-byte JPEG) are excluded.
         """
+        return [page async for page in self.iter_pages(config, wait_for_button)]
+
+    async def iter_pages(
+        self,
+        config: ScanConfig | None = None,
+        wait_for_button: bool = False,
+    ) -> AsyncIterator[tuple[int, int, bytes]]:
+        """Scan and yield (sheet, side, jpeg_data) as each page arrives.
+
+        Like :meth:`scan`, but pages are handed over as soon as they have
+        been transferred.  Only a few pages are buffered ahead of the
+        consumer; beyond that the transfer waits.  Leaving the loop early
+        aborts the scan.
+        """
         if config is None:
             config = ScanConfig()
         if wait_for_button:
@@ -255,9 +508,46 @@ class Scanner:
             await self._discovery.wait_for_button()
             log.info("Button pressed!")
         log.info("Starting scan...")
-        data_ch = DataChannel(self.host, self.data_port, self.token)
-        pages = await data_ch.run_scan(config)
-        return [(s, sd, d) for s, sd, d in pages if d]
+        data_ch = await self._get_data_channel()
+        # None marks the end of the scan
+        queue: asyncio.Queue[tuple[int, int, bytes] | None] = asyncio.Queue(
+            _PAGE_QUEUE_SIZE,
+        )
+        # Chunks of the page being received
+        parts: list[bytes] = []
+
+        # Chunk callbacks are awaited by the scan loop one at a time, so
+        # pages are queued in transfer order and a full queue stalls the
+        # transfer itself
+        async def on_chunk(sheet: int, side: int, chunk: bytes, final: bool) -> None:
+            parts.append(chunk)
+            if final:
+                data = b"".join(parts)
+                parts.clear()
+                if data:
+                    await queue.put((sheet, side, data))
+
+        async def run() -> None:
+            # The end marker waits for room like any page.  It is skipped on
+            # cancellation, which means iter_pages is closing and no longer
+            # reads the queue.
+            try:
+                await data_ch.run_scan(config, on_chunk=on_chunk)
+            except Exception:
+                await queue.put(None)
+                raise
+            await queue.put(None)
+
+        task = asyncio.create_task(run())
+        try:
+            while (page := await queue.get()) is not None:
+                yield page
+            await task
+        finally:
+            if not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
 
     async def scan_to_files(
         self,
@@ -267,6 +557,8 @@ class Scanner:
     ) -> list[Path]:
         """Scan and save image files (JPEG or TIFF depending on color mode).
 
+        Page data is streamed to disk chunk by chunk rather than buffered.
+
         If ``wait_for_button`` is True, waits for a physical button press
         before starting. Otherwise, triggers the scan directly (paper must
         be in the ADF).
@@ -281,24 +573,71 @@ class Scanner:
             config = ScanConfig()
 
         is_bw = config.color_mode == ColorMode.BW
-
-        async def on_page(sheet: int, side: int, data: bytes) -> None:
-            if not data:
-                return
-            side_name = "front" if side == 0 else "back"
-            ext = "tiff" if is_bw else "jpg"
-            filename = output / f"page_{sheet:03d}_{side_name}.{ext}"
-            filename.write_bytes(data)
-            saved.append(filename)
-            log.info("Saved: %s (%d bytes)", filename, len(data))
+        # Files being written, keyed by (sheet, side): (path, file, bytes written)
+        writing: dict[tuple[int, int], tuple[Path, BinaryIO, int]] = {}
+
+        def write_chunk(sheet: int, side: int, data: bytes, final: bool) -> None:
+            key = (sheet, side)
+            entry = writing.get(key)
+            if entry is None:
+                if not data:
+                    return
+                side_name = "front" if side == 0 else "back"
+                ext = "tiff" if is_bw else "jpg"
+                filename = output / f"page_{sheet:03d}_{side_name}.{ext}"
+                entry = (filename, filename.open("wb"), 0)
+            filename, f, written = entry
+            f.write(data)
+            written += len(data)
+            if final:
+                f.close()
+                del writing[key]
+                saved.append(filename)
+                log.info("Saved: %s (%d bytes)", filename, written)
+            else:
+                writing[key] = (filename, f, written)
+
+        # Disk writes run in a worker thread, in order, so the scan loop
+        # only waits for them when the queue is full
+        queue: asyncio.Queue[tuple[int, int, bytes, bool] | None] = asyncio.Queue(
+            _WRITE_QUEUE_SIZE,
+        )
+        write_error: Exception | None = None
+
+        async def file_writer() -> None:
+            nonlocal write_error
+            while (item := await queue.get()) is not None:
+                # After a failure keep draining so on_chunk never blocks
+                if write_error is None:
+                    try:
+                        await asyncio.to_thread(write_chunk, *item)
+                    except Exception as e:
+                        write_error = e
+
+        async def on_chunk(sheet: int, side: int, data: bytes, final: bool) -> None:
+            if write_error is not None:
+                raise write_error
+            await queue.put((sheet, side, data, final))
 
         if wait_for_button:
             log.info("Waiting for scan button press...")
             await self._discovery.wait_for_button()
             log.info("Button pressed!")
         log.info("Starting scan...")
-        data_ch = DataChannel(self.host, self.data_port, self.token)
-        await data_ch.run_scan(config, on_page=on_page)
+        data_ch = await self._get_data_channel()
+        writer_task = asyncio.create_task(file_writer())
+        try:
+            await data_ch.run_scan(config, on_chunk=on_chunk)
+        finally:
+            # Let queued and in-flight writes finish before touching files
+            await queue.put(None)
+            await writer_task
+            # Remove partially written pages if the scan was interrupted
+            for filename, f, _ in writing.values():
+                f.close()
+                filename.unlink(missing_ok=True)
+        if write_error is not None:
+            raise write_error
         return saved
 
     async def disconnect(self) -> None:
@@ -307,6 +646,10 @@ class Scanner:
             await self._control.deregister(self.token)
         except (ConnectionError, OSError) as e:
             log.warning("Deregister failed: %s", e)
+        await self._control.close()
+        if self._data is not None:
+            await self._data.aclose()
+            self._data = None
         await self._discovery.stop_heartbeat()
         self._connected = False
         log.info("Disconnected")
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import socket
 import struct
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 
 from scansnap.packets import (
     CLIENT_NOTIFY_PORT,
+    MAGIC,
     ReserveRequest,
     ReleaseRequest,
     GetWifiStatusRequest,
@@ -18,65 +21,129 @@ from scansnap.packets import (
 
 log = logging.getLogger(__name__)
 
+# Precompiled decoders for big-endian length prefixes and status fields
+_UNPACK_LEN = struct.Struct("!I").unpack
+_UNPACK_I32 = struct.Struct("!i").unpack_from
+
 
 async def _read_exact(reader: asyncio.StreamReader, n: int) -> bytes:
     """Read exactly n bytes from stream."""
-    buf = bytearray()
-    while len(buf) < n:
-        chunk = await reader.read(n - len(buf))
-        if not chunk:
-            raise ConnectionError("Connection closed while reading")
-        buf.extend(chunk)
-    return bytes(buf)
+    try:
+        return await reader.readexactly(n)
+    except asyncio.IncompleteReadError as e:
+        raise ConnectionError("Connection closed while reading") from e
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> bytes:
+    """Read one length-prefixed control channel response."""
+    len_data = await _read_exact(reader, 4)
+    resp_len = _UNPACK_LEN(len_data)[0]
+    rest = await _read_exact(reader, resp_len - 4)
+    return len_data + rest
+
+
+async def _read_ack(reader: asyncio.StreamReader) -> bytes:
+    """Read the 16-byte register/deregister ack (not length-prefixed)."""
+    return await _read_exact(reader, 16)
 
 
 class ControlSession:
-    """Manages a TCP control channel connection to the scanner."""
+    """Manages a TCP control channel connection to the scanner.
+
+    By default every request uses its own connection.  With ``keep_alive``
+    one connection is kept open and reused for consecutive requests; if
+    the scanner has closed it in the meantime the request is resent once
+    on a fresh connection.
+    """
 
-    def __init__(self, host: str, port: int) -> None:
+    def __init__(self, host: str, port: int, keep_alive: bool = False) -> None:
         self.host = host
         self.port = port
+        self._keep_alive = keep_alive
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
+        # Serialises requests on the kept-alive connection
+        self._lock = asyncio.Lock()
+        # In-flight status checks by token, shared by concurrent callers
+        self._status_inflight: dict[bytes, asyncio.Task[GetWifiStatusResponse]] = {}
 
     async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
         reader, writer = await asyncio.open_connection(self.host, self.port)
-        # Read the welcome packet
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            # Requests are small and each waits for its response; don't let
+            # Nagle hold them back waiting for the scanner's delayed ACK
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self._keep_alive:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # The welcome carries no data we use; only check its magic
         welcome_data = await _read_exact(reader, WelcomePacket.size())
-        WelcomePacket.unpack(welcome_data)
+        if welcome_data[4:8] != MAGIC:
+            writer.close()
+            raise ValueError("Not a VENS welcome")
         log.debug("Received welcome from %s:%d", self.host, self.port)
         return reader, writer
 
+    async def _exchange(
+        self,
+        data: bytes,
+        read: Callable[[asyncio.StreamReader], Awaitable[bytes]],
+    ) -> bytes:
+        """Send a request and read its response with *read*."""
+        if not self._keep_alive:
+            reader, writer = await self._connect()
+            try:
+                # No drain(): the request is tiny and the read below yields
+                # to the loop while the transport flushes it
+                writer.write(data)
+                return await read(reader)
+            finally:
+                writer.close()
+                await writer.wait_closed()
+
+        async with self._lock:
+            while True:
+                reused = self._writer is not None and not self._writer.is_closing()
+                if not reused:
+                    self._reader, self._writer = await self._connect()
+                reader, writer = self._reader, self._writer
+                try:
+                    writer.write(data)
+                    return await read(reader)
+                except (ConnectionError, OSError) as e:
+                    await self.close()
+                    if not reused:
+                        raise
+                    log.debug("Control connection dropped (%s), reconnecting", e)
+                except BaseException:
+                    # The stream position is unknown after a partial read
+                    await self.close()
+                    raise
+
     async def _send_recv(self, data: bytes) -> bytes:
-        """Open a new connection, send data, read response, close."""
-        reader, writer = await self._connect()
-        try:
-            writer.write(data)
-            await writer.drain()
-            # Read response length first (4 bytes)
-            len_data = await _read_exact(reader, 4)
-            resp_len = int.from_bytes(len_data, "big")
-            rest = await _read_exact(reader, resp_len - 4)
-            return len_data + rest
-        finally:
+        """Send data and read a length-prefixed response."""
+        return await self._exchange(data, _read_frame)
+
+    async def close(self) -> None:
+        """Close the kept-alive connection, if any."""
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
             writer.close()
-            await writer.wait_closed()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
 
     async def register(self, token: bytes) -> bytes:
         """Register with the scanner. Returns the raw response (16-byte ack)."""
         req = ReleaseRequest(token=token, action=1)
         log.info("Registering with scanner...")
-        reader, writer = await self._connect()
-        try:
-            writer.write(req.pack())
-            await writer.drain()
-            # Register response is a 16-byte ack, not length-prefixed
-            resp = await _read_exact(reader, 16)
-            log.info("Registration response: %d bytes, hex=%s", len(resp), resp.hex())
-            return resp
-        finally:
-            writer.close()
-            await writer.wait_closed()
+        # Register response is a 16-byte ack, not length-prefixed
+        resp = await self._exchange(req.pack(), _read_ack)
+        log.info("Registration response: %d bytes", len(resp))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Registration response hex=%s", resp.hex())
+        return resp
 
     async def configure(
         self,
@@ -107,7 +174,7 @@ class ControlSession:
     ) -> bool:
         """Send ReserveRequest and return True if accepted, False if rejected."""
         resp = await self.configure(token, client_ip, notify_port, identity)
-        status = struct.unpack_from("!i", resp, 8)[0]
+        status = _UNPACK_I32(resp, 8)[0]
         if status == 0:
             log.info("Pairing accepted")
             return True
@@ -115,7 +182,18 @@ class ControlSession:
         return False
 
     async def check_status(self, token: bytes) -> GetWifiStatusResponse:
-        """Check connection status."""
+        """Check connection status.
+
+        Concurrent calls for the same token share one request.
+        """
+        task = self._status_inflight.get(token)
+        if task is None:
+            task = asyncio.create_task(self._check_status(token))
+            self._status_inflight[token] = task
+            task.add_done_callback(lambda _: self._status_inflight.pop(token, None))
+        return await asyncio.shield(task)
+
+    async def _check_status(self, token: bytes) -> GetWifiStatusResponse:
         req = GetWifiStatusRequest(token=token)
         resp = await self._send_recv(req.pack())
         status = GetWifiStatusResponse.unpack(resp)
@@ -126,13 +204,6 @@ class ControlSession:
         """Deregister from the scanner."""
         req = ReleaseRequest(token=token, action=0)
         log.info("Deregistering...")
-        reader, writer = await self._connect()
-        try:
-            writer.write(req.pack())
-            await writer.drain()
-            resp = await _read_exact(reader, 16)
-            log.info("Deregistration response: %d bytes", len(resp))
-            return resp
-        finally:
-            writer.close()
-            await writer.wait_closed()
+        resp = await self._exchange(req.pack(), _read_ack)
+        log.info("Deregistration response: %d bytes", len(resp))
+        return resp